@@ -28,21 +28,28 @@ import logging
 import typing
 import abc
 import time
-from datetime import datetime
+import threading
+import concurrent.futures
+import functools
+import contextlib
+import collections
+import itertools
 import os
-import re
+import gzip
 import json
 
 # Kodi libs
 import xbmcgui
 
 # AKL libs
-from akl.utils import kodi, io, net, text
+from akl.utils import kodi, io, net, text, scrape_cache
 from akl import constants, platforms, settings
 from akl import api
 
 from akl.api import ROMObj
 
+logger = logging.getLogger(__name__)
+
 
 # --- Scraper use cases ---------------------------------------------------------------------------
 # THIS DOCUMENTATION IS OBSOLETE, IT MUST BE UPDATED TO INCLUDE THE SCRAPER DISK CACHE.
@@ -173,6 +180,74 @@ class ScraperSettings(object):
         return scraper_settings
     
 
+# No-Intro BIOS filename tag.
+_BIOS_TAG = '[BIOS]'
+# Marks the deleted entries in Scraper.disk_caches_changes.
+_DELETED = object()
+# Encoders of the disk cache files and journal lines, built once instead of on every json.dumps().
+_encode_disk_cache = json.JSONEncoder(ensure_ascii=False, sort_keys=True, separators=(',', ':')).encode
+_encode_journal_entry = json.JSONEncoder(ensure_ascii=False).encode
+
+
+# Scraper.disk_caches_dirty. Scrapers in other addons change disk_caches directly and set the
+# flag, untracked keeps those caches so they are written fully and never to the journal, which
+# only has the changes made with _update_disk_cache() and _delete_from_disk_cache().
+class _DirtyFlags(dict):
+
+    def __init__(self):
+        super().__init__()
+        self.untracked = set()
+
+    def __setitem__(self, cache_type, dirty):
+        super().__setitem__(cache_type, dirty)
+        if dirty:
+            self.untracked.add(cache_type)
+        else:
+            self.untracked.discard(cache_type)
+
+    # Marks the cache dirty with its changes recorded in disk_caches_changes.
+    def set_tracked(self, cache_type):
+        super().__setitem__(cache_type, True)
+
+
+# Identifies a version of a file. A file saved with saveStrToFileAtomic() is a new file, so
+# the inode changes even if the size and modification time are the same.
+def _get_file_generation(file_path: str):
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        return None
+    return [stat.st_ino, stat.st_size, stat.st_mtime_ns]
+
+
+# Loads a JSON list straight into a frozenset. The file is read as bytes in one call and
+# decoded by json.loads(), which skips the text layer and the intermediate list of json.load().
+def _load_JSON_set(filename) -> frozenset:
+    logger.debug('_load_JSON_set() Loading "%s"', filename)
+    with open(filename, 'rb') as file:
+        return frozenset(json.loads(file.read()))
+
+
+# Loads the MAME BIOS, Devices and Mechanical databases of the Offline Scraper.
+# Stored as frozensets to execute efficiently 'x in y' operation.
+@functools.lru_cache(maxsize=4)
+def _load_MAME_sets(addon_dir: str) -> typing.Tuple[frozenset, frozenset, frozenset]:
+    BIOS_path = os.path.join(addon_dir, 'data-AOS', 'MAME_BIOSes.json')
+    Devices_path = os.path.join(addon_dir, 'data-AOS', 'MAME_Devices.json')
+    Mechanical_path = os.path.join(addon_dir, 'data-AOS', 'MAME_Mechanical.json')
+
+    return _load_JSON_set(BIOS_path), _load_JSON_set(Devices_path), _load_JSON_set(Mechanical_path)
+
+
+# Builds the item shown for an asset in the asset select dialog.
+# Items are only used in a dialog, so they are created offscreen (no GUI lock needed).
+def _new_asset_ListItem(asset: dict) -> xbmcgui.ListItem:
+    url_thumb = asset['url_thumb']
+    listitem_obj = xbmcgui.ListItem(label=asset['display_name'], label2=url_thumb, offscreen=True)
+    listitem_obj.setArt({'icon': url_thumb, 'thumb': url_thumb})
+    return listitem_obj
+
+
 # This class is used to filter No-Intro BIOS ROMs and MAME BIOS, Devices and Mecanichal machines.
 # No-Intro BIOSes are easy to filter, filename starts with '[BIOS]'
 # MAME is more complicated. The Offline Scraper includes 3 JSON filenames
@@ -190,54 +265,218 @@ class FilterROM(object):
         self.settings = settings
         self.platform = platform
         self.addon_dir = self.settings['scraper_akloffline_addon_code_dir']
+        self._is_mame = self.platform == platforms.PLATFORM_MAME_LONG
 
         # If platform is MAME load the BIOS, Devices and Mechanical databases.
-        if self.platform == platforms.PLATFORM_MAME_LONG:
-            BIOS_path = os.path.join(self.addon_dir, 'data-AOS', 'MAME_BIOSes.json')
-            Devices_path = os.path.join(self.addon_dir, 'data-AOS', 'MAME_Devices.json')
-            Mechanical_path = os.path.join(self.addon_dir, 'data-AOS', 'MAME_Mechanical.json')
-            BIOS_list = self._load_JSON(BIOS_path)
-            Devices_list = self._load_JSON(Devices_path)
-            Mechanical_list = self._load_JSON(Mechanical_path)
-            # Convert lists to sets to execute efficiently 'x in y' operation.
-            self.BIOS_set = {i for i in BIOS_list}
-            self.Devices_set = {i for i in Devices_list}
-            self.Mechanical_set = {i for i in Mechanical_list}
-
-    def _load_JSON(self, filename):
-        self.logger.debug('FilterROM::_load_JSON() Loading "{}"'.format(filename))
-        with open(filename) as file:
-            data = json.load(file)
-
-        return data
+        # The databases are loaded once and shared between instances.
+        if self._is_mame:
+            self.BIOS_set, self.Devices_set, self.Mechanical_set = _load_MAME_sets(self.addon_dir)
 
     # Returns True if ROM is filtered, False otherwise.
     def ROM_is_filtered(self, basename):
-        self.logger.debug('FilterROM::ROM_is_filtered() Testing "{}"'.format(basename))
+        # Called for every scanned file, the debug messages are only built if they are logged.
+        log_debug = self.logger.isEnabledFor(logging.DEBUG)
+        if log_debug:
+            self.logger.debug('FilterROM::ROM_is_filtered() Testing "%s"', basename)
         if not self.settings['scan_ignore_bios']:
-            self.logger.debug('FilterROM::ROM_is_filtered() Filters disabled. Return False.')
+            if log_debug:
+                self.logger.debug('FilterROM::ROM_is_filtered() Filters disabled. Return False.')
             return False
 
-        if self.platform == platforms.PLATFORM_MAME_LONG:
+        if self._is_mame:
             if basename in self.BIOS_set:
-                self.logger.debug('FilterROM::ROM_is_filtered() Filtered MAME BIOS "{}"'.format(basename))
+                self.logger.debug('FilterROM::ROM_is_filtered() Filtered MAME BIOS "%s"', basename)
                 return True
             if basename in self.Devices_set:
-                self.logger.debug('FilterROM::ROM_is_filtered() Filtered MAME Device "{}"'.format(basename))
+                self.logger.debug('FilterROM::ROM_is_filtered() Filtered MAME Device "%s"', basename)
                 return True
             if basename in self.Mechanical_set:
-                self.logger.debug('FilterROM::ROM_is_filtered() Filtered MAME Mechanical "{}"'.format(basename))
+                self.logger.debug('FilterROM::ROM_is_filtered() Filtered MAME Mechanical "%s"', basename)
                 return True
         else:
             # If it is not MAME it is No-Intro
             # Name of bios is: '[BIOS] Rom name example (Rev A).zip'
-            BIOS_m = re.findall('\[BIOS\]', basename)
-            if BIOS_m:
-                self.logger.debug('FilterROM::ROM_is_filtered() Filtered No-Intro BIOS "{}"'.format(basename))
+            # Plain substring test, no need for the regex engine here.
+            if _BIOS_TAG in basename:
+                self.logger.debug('FilterROM::ROM_is_filtered() Filtered No-Intro BIOS "%s"', basename)
                 return True
 
         return False
 
+
+#
+# Coalesces candidate searches when scraping multiple ROMs.
+# * Searches with the same scraper batch key (see Scraper.get_candidates_batch_key()) are
+#   done only once, for example for regional variants of the same game.
+# * Scrapers which support batch searches get the searches prefetched in batches of
+#   MAX_BATCH_SIZE with Scraper.get_candidates_batch().
+#
+class CandidateLoader(object):
+    MAX_BATCH_SIZE = 10
+    # Searches of a scraper done ahead of the scraped ROM. Searches for ROMs not reached,
+    # e.g. when the user cancels, would waste the API quota.
+    READ_AHEAD_WINDOW = 5
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self.loaded = {}
+        # Searches running in the read ahead worker, in ROM order. Key -> Future.
+        self.pending = {}
+        # Searches waiting for room in the read ahead window. Scraper name ->
+        # deque of (key, scraper_obj, search_term, rom, platform).
+        self.read_ahead_queues = {}
+        self.executor = None
+
+    # Searches candidates for all the given (search_term, rom, platform) tuples in batches.
+    # Only done if the scraper supports batch searches.
+    def prefetch(self, scraper_obj: Scraper, search_items: list):
+        if not scraper_obj.supports_candidates_batch():
+            return
+        
+        pending = {}
+        for search_term, rom, platform in search_items:
+            key = self._get_key(scraper_obj, search_term, rom, platform)
+            if key is None or key in self.loaded or key in pending:
+                continue
+            pending[key] = (search_term, rom, platform)
+        
+        keys = list(pending.keys())
+        for i in range(0, len(keys), CandidateLoader.MAX_BATCH_SIZE):
+            batch_keys = keys[i:i + CandidateLoader.MAX_BATCH_SIZE]
+            status_dic = kodi.new_status_dic('No error')
+            results = scraper_obj.get_candidates_batch([pending[key] for key in batch_keys], status_dic)
+            if not status_dic['status'] or results is None:
+                # Errors are reported when the candidates are searched one by one.
+                self.logger.debug('CandidateLoader.prefetch() Batch search failed: %s', status_dic['msg'])
+                return
+            for key, candidates in zip(batch_keys, results):
+                if candidates is not None:
+                    self._store(scraper_obj, key, candidates)
+
+    # Searches the candidates of the given (search_term, rom, platform) tuples in a background
+    # thread, in order, while the ROMs before them are scraped. Only done if the scraper supports
+    # concurrent searches. A single worker is used to keep the request rate of the scraper.
+    # At most READ_AHEAD_WINDOW searches are done ahead, load() lets the next ones start.
+    def read_ahead(self, scraper_obj: Scraper, search_items: list):
+        if not scraper_obj.supports_concurrent_search():
+            return
+        
+        scraper_name = scraper_obj.get_name()
+        queue = self.read_ahead_queues.setdefault(scraper_name, collections.deque())
+        for search_term, rom, platform in search_items:
+            key = self._get_key(scraper_obj, search_term, rom, platform)
+            if key is None or key in self.loaded:
+                continue
+            queue.append((key, scraper_obj, search_term, rom, platform))
+        self._fill_read_ahead(scraper_name)
+
+    # Stops the read ahead worker. Searches not started yet are cancelled.
+    def close(self):
+        for future in self.pending.values():
+            future.cancel()
+        self.pending = {}
+        self.read_ahead_queues = {}
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+
+    # Same contract as Scraper.get_candidates().
+    def load(self, scraper_obj: Scraper, search_term: str, rom: ROMObj, platform, status_dic):
+        key = self._get_key(scraper_obj, search_term, rom, platform)
+        if key is not None and key in self.pending:
+            self._drop_read_ahead_before(key)
+            candidates, search_status_dic, deferred_msg = self.pending.pop(key).result()
+            self._fill_read_ahead(key[0])
+            if candidates is not None:
+                self._store(scraper_obj, key, candidates)
+            elif deferred_msg is not None:
+                # The scraper error is reported and counted now, once, as in a search done here.
+                scraper_obj._handle_error(status_dic, deferred_msg)
+                return None
+            elif search_status_dic is not None and not search_status_dic['status']:
+                status_dic.update(search_status_dic)
+                return None
+        if key is not None and (key in self.loaded or self._load_stored(scraper_obj, key)):
+            self.logger.debug('CandidateLoader.load() Reusing candidates for "%s"', search_term)
+            self._persist(scraper_obj, key, self.loaded[key], rom, platform)
+            return list(self.loaded[key])
+        
+        candidates = scraper_obj.get_candidates(search_term, rom, platform, status_dic)
+        # Errors (None) are never stored so the search is repeated for the next ROM.
+        if key is not None and candidates is not None:
+            self._store(scraper_obj, key, candidates)
+            self._persist(scraper_obj, key, candidates, rom, platform)
+        return candidates
+
+    # Starts the queued searches of the scraper until READ_AHEAD_WINDOW are pending.
+    def _fill_read_ahead(self, scraper_name: str):
+        queue = self.read_ahead_queues.get(scraper_name)
+        if not queue:
+            return
+        num_pending = sum(1 for key in self.pending if key[0] == scraper_name)
+        while queue and num_pending < self.READ_AHEAD_WINDOW:
+            key, scraper_obj, search_term, rom, platform = queue.popleft()
+            if key in self.loaded or key in self.pending:
+                continue
+            if self.executor is None:
+                self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+            self.pending[key] = self.executor.submit(self._search, scraper_obj, search_term, rom, platform)
+            num_pending += 1
+
+    # The ROMs are scraped in order, so the pending searches of the scraper before the loaded
+    # one were skipped (e.g. the ROM failed) and only take room in the read ahead window.
+    def _drop_read_ahead_before(self, key):
+        for pending_key in list(self.pending):
+            if pending_key == key:
+                return
+            if pending_key[0] == key[0]:
+                self.pending.pop(pending_key).cancel()
+
+    def _get_key(self, scraper_obj: Scraper, search_term: str, rom: ROMObj, platform):
+        batch_key = scraper_obj.get_candidates_batch_key(search_term, rom, platform)
+        if batch_key is None:
+            return None
+        return (scraper_obj.get_name(), batch_key)
+
+    # Runs in the read ahead worker. Returns (candidates, status_dic, deferred error message).
+    # The scraper errors are deferred, load() reports them when the ROM is scraped so they are
+    # counted once and not for ROMs the scan never reaches. After an exception the search is
+    # repeated by load().
+    def _search(self, scraper_obj: Scraper, search_term: str, rom: ROMObj, platform):
+        status_dic = kodi.new_status_dic('No error')
+        with Scraper.deferring_errors() as deferred_msgs:
+            try:
+                candidates = scraper_obj.get_candidates(search_term, rom, platform, status_dic)
+            except Exception:
+                self.logger.exception('CandidateLoader._search() Searching "%s" failed', search_term)
+                return None, None, None
+        if not status_dic['status']:
+            self.logger.debug('CandidateLoader._search() Searching "%s" failed: %s', search_term, status_dic['msg'])
+            return None, status_dic, deferred_msgs[-1] if deferred_msgs else None
+        return candidates, status_dic, None
+
+    # Loads the candidates of a previous scan from the scraper persistent cache, if any.
+    # Only done by load(), after Scraper.clear_cache() removed the results of a rescraped ROM.
+    def _load_stored(self, scraper_obj: Scraper, key) -> bool:
+        results_cache = scraper_obj.get_search_results_cache()
+        if results_cache is None:
+            return False
+        candidates = results_cache.get_candidates(repr(key[1]))
+        if candidates is None:
+            return False
+        self.loaded[key] = candidates
+        return True
+
+    def _store(self, scraper_obj: Scraper, key, candidates: list):
+        self.loaded[key] = candidates
+
+    # Results are written to the persistent cache when a ROM uses them, recording that ROM.
+    def _persist(self, scraper_obj: Scraper, key, candidates: list, rom: ROMObj, platform):
+        results_cache = scraper_obj.get_search_results_cache()
+        if results_cache is not None:
+            rom_key = Scraper.get_search_results_rom_key(rom.get_identifier(), platform)
+            results_cache.put_candidates(repr(key[1]), candidates, rom_key)
+
          
 #
 # Main scraping logic.
@@ -256,9 +495,76 @@ class ScrapeStrategy(object):
     ACTION_ASSET_LOCAL_ASSET = 100
     ACTION_ASSET_SCRAPER = 200
 
+    # --- Actions per policy ---
+    # Metadata policy -> (action if NFO file not found, action if NFO file found)
+    METADATA_POLICY_ACTIONS = {
+        constants.SCRAPE_POLICY_TITLE_ONLY: (ACTION_META_TITLE_ONLY, ACTION_META_TITLE_ONLY),
+        constants.SCRAPE_POLICY_LOCAL_ONLY: (ACTION_META_TITLE_ONLY, ACTION_META_NFO_FILE),
+        constants.SCRAPE_POLICY_LOCAL_AND_SCRAPE: (ACTION_META_SCRAPER, ACTION_META_NFO_FILE),
+        constants.SCRAPE_POLICY_SCRAPE_ONLY: (ACTION_META_SCRAPER, ACTION_META_SCRAPER),
+    }
+    METADATA_POLICY_DESCRIPTIONS = {
+        constants.SCRAPE_POLICY_TITLE_ONLY: 'Read NFO file OFF | Scraper OFF',
+        constants.SCRAPE_POLICY_LOCAL_ONLY: 'Read NFO file ON | Scraper OFF',
+        constants.SCRAPE_POLICY_LOCAL_AND_SCRAPE: 'Read NFO file ON | Scraper ON',
+        constants.SCRAPE_POLICY_SCRAPE_ONLY: 'Read NFO file OFF | Scraper ON',
+    }
+    ASSETS_POLICY_DESCRIPTIONS = {
+        constants.SCRAPE_POLICY_LOCAL_ONLY: 'Local images ON | Scraper OFF',
+        constants.SCRAPE_POLICY_LOCAL_AND_SCRAPE: 'Local images ON | Scraper ON',
+        constants.SCRAPE_POLICY_SCRAPE_ONLY: 'Local images OFF | Scraper ON',
+    }
+
+    # Asset policy -> actions indexed by (scraper supports asset << 1 | local asset found)
+    ASSETS_POLICY_ACTIONS = {
+        constants.SCRAPE_POLICY_LOCAL_ONLY: (
+            ACTION_ASSET_LOCAL_ASSET, ACTION_ASSET_LOCAL_ASSET, ACTION_ASSET_LOCAL_ASSET, ACTION_ASSET_LOCAL_ASSET),
+        constants.SCRAPE_POLICY_LOCAL_AND_SCRAPE: (
+            ACTION_ASSET_LOCAL_ASSET, ACTION_ASSET_LOCAL_ASSET, ACTION_ASSET_SCRAPER, ACTION_ASSET_LOCAL_ASSET),
+        constants.SCRAPE_POLICY_SCRAPE_ONLY: (
+            ACTION_ASSET_LOCAL_ASSET, ACTION_ASSET_LOCAL_ASSET, ACTION_ASSET_SCRAPER, ACTION_ASSET_SCRAPER),
+    }
+    ASSET_ACTION_DESCRIPTIONS = {
+        ACTION_ASSET_NONE: 'None (existing asset kept)',
+        ACTION_ASSET_LOCAL_ASSET: 'Local asset',
+        ACTION_ASSET_SCRAPER: 'Scraper',
+    }
+
+    # _new_gamedata_dic() key -> ROMObj setter, applied by _apply_candidate_on_metadata()
+    METADATA_SETTERS = (
+        ('year', 'set_releaseyear'),
+        ('genre', 'set_genre'),
+        ('developer', 'set_developer'),
+        ('nplayers', 'set_number_of_players'),
+        ('nplayers_online', 'set_number_of_players_online'),
+        ('esrb', 'set_esrb_rating'),
+        ('pegi', 'set_pegi_rating'),
+        ('plot', 'set_plot'),
+        ('tags', 'set_tags'),
+    )
+
+    SETTING_TRANSLATIONS = {
+        constants.SCRAPE_ACTION_NONE: 'No action',
+        constants.SCRAPE_POLICY_TITLE_ONLY: 'Use title only',
+        constants.SCRAPE_POLICY_LOCAL_ONLY: 'Use local files only',
+        constants.SCRAPE_POLICY_LOCAL_AND_SCRAPE: 'Local / Scrape',
+        constants.SCRAPE_POLICY_SCRAPE_ONLY: 'Scrape only',
+        constants.SCRAPE_MANUAL: 'Manual selection',
+        constants.SCRAPE_AUTOMATIC: 'Automatic selection',
+    }
+
     SCRAPE_ROM = 'ROM'
     SCRAPE_LAUNCHER = 'Launcher'
 
+    # Maximum number of threads used to scan the asset directories.
+    CACHE_ASSETS_MAX_WORKERS = 8
+
+    # Minimum time in seconds between progress dialog updates when scraping multiple ROMs.
+    PROGRESS_UPDATE_INTERVAL = 0.25
+
+    # Maximum number of images downloaded at the same time.
+    DOWNLOAD_MAX_WORKERS = 8
+
     # --- Constructor ----------------------------------------------------------------------------
     # @param settings: [dict] Addon settings.
     def __init__(self,
@@ -283,7 +589,7 @@ class ScrapeStrategy(object):
         # Display error reported in status_dic as Kodi dialogs.
         status_dic = kodi.new_status_dic('No error')
         if scraper is not None:
-            scraper.check_before_scraping(status_dic)
+            scraper.check_before_scraping_cached(status_dic)
             if not status_dic['status']:
                 kodi.dialog_OK(status_dic['msg'])
                 self.scraper_settings.scrape_metadata_policy = constants.SCRAPE_ACTION_NONE
@@ -297,23 +603,39 @@ class ScrapeStrategy(object):
             self.asset_scraper_obj = Null_Scraper()
                 
         self.meta_and_asset_scraper_same = self.meta_scraper_obj is self.asset_scraper_obj
+
+        # Single keep-alive HTTP session shared by the metadata and asset scrapers.
+        self.http_session = net.start_http_session()
+        self.meta_scraper_obj.set_http_session(self.http_session)
+        self.asset_scraper_obj.set_http_session(self.http_session)
         self.pdialog = progress_dialog
         self.pdialog_verbose = scraper_settings.show_info_verbose
+        # NFO files found per ROM directory, lowercase name -> name. Filled by _cache_NFO_files()
+        # when scraping multiple ROMs so the NFO check does not need a stat() call per ROM.
+        self.NFO_files_cache = {}
+        self.candidate_loader = CandidateLoader()
+        # Candidates cache entries of the ROMs being scraped, per scraper. Filled by _prefetch_candidates().
+        self.cached_candidates = {}
+        # Images downloading in the background. Lazy created by _download_image_in_background().
+        self.download_executor = None
+        self.download_futures = []
         
         self.logger.debug('========================== Applied scraper settings ==========================')
-        self.logger.debug('Metadata policy:      {}'.format(self._translate(scraper_settings.scrape_metadata_policy)))
-        self.logger.debug('Search term input:    {}'.format(self._translate(scraper_settings.search_term_mode)))
-        self.logger.debug('Game selection:       {}'.format(self._translate(scraper_settings.game_selection_mode)))
-        self.logger.debug('Metadata IDs:         {}'.format(', '.join(scraper_settings.metadata_IDs_to_scrape)))
-        self.logger.debug('Assets policy:        {}'.format(self._translate(scraper_settings.scrape_assets_policy)))
-        self.logger.debug('Asset selection:      {}'.format(self._translate(scraper_settings.asset_selection_mode)))
-        self.logger.debug('Asset IDs:            {}'.format(', '.join(scraper_settings.asset_IDs_to_scrape)))
+        self.logger.debug('Metadata policy:      %s', self._translate(scraper_settings.scrape_metadata_policy))
+        self.logger.debug('Search term input:    %s', self._translate(scraper_settings.search_term_mode))
+        self.logger.debug('Game selection:       %s', self._translate(scraper_settings.game_selection_mode))
+        self.logger.debug('Metadata IDs:         %s', ', '.join(scraper_settings.metadata_IDs_to_scrape))
+        self.logger.debug('Assets policy:        %s', self._translate(scraper_settings.scrape_assets_policy))
+        self.logger.debug('Asset selection:      %s', self._translate(scraper_settings.asset_selection_mode))
+        self.logger.debug('Asset IDs:            %s', ', '.join(scraper_settings.asset_IDs_to_scrape))
         self.logger.debug('Overwrite existing:')
-        self.logger.debug(' - Metadata           {}'.format('Yes' if scraper_settings.overwrite_existing_meta else 'No'))
-        self.logger.debug(' - Assets             {}'.format('Yes' if scraper_settings.overwrite_existing_assets else 'No'))
-        self.logger.debug('Ignore scrape title:  {}'.format('Yes' if scraper_settings.ignore_scrap_title else 'No'))
-        self.logger.debug('Update NFO files:     {}'.format('Yes' if scraper_settings.update_nfo_files else 'No'))
+        self.logger.debug(' - Metadata           %s', 'Yes' if scraper_settings.overwrite_existing_meta else 'No')
+        self.logger.debug(' - Assets             %s', 'Yes' if scraper_settings.overwrite_existing_assets else 'No')
+        self.logger.debug('Ignore scrape title:  %s', 'Yes' if scraper_settings.ignore_scrap_title else 'No')
+        self.logger.debug('Update NFO files:     %s', 'Yes' if scraper_settings.update_nfo_files else 'No')
         self.logger.debug('==============================================================================')
+
+        self._prepare_actions()
  
     def process_roms(self, entity_type: int, entity_id) -> typing.List[ROMObj]:
         try:
@@ -330,31 +652,47 @@ class ScrapeStrategy(object):
         self.pdialog.startProgress('Scraping multiple ROMs', num_items)
         self.logger.debug('============================== Scraping ROMs ==============================')
         
-        all_paths = []
-        for rom in roms:
-            all_paths.extend(rom.get_all_asset_paths())
-        self._cache_assets(all_paths)
-        
-        for rom in roms:
-            self.pdialog.updateProgress(num_items_checked)
-            num_items_checked = num_items_checked + 1
-            ROM_name = rom.get_identifier()
-            self.pdialog.updateMessage(f'Scraping ROM {ROM_name}...')
-            try:
-                self._process_ROM(rom)
-            except Exception:
-                self.logger.exception(f'Could not scrape "{ROM_name}"')
-                kodi.notify_warn(f'Could not scrape "{ROM_name}"')
+        canceled = False
+        try:
+            all_paths = []
+            for rom in roms:
+                all_paths.extend(rom.get_all_asset_paths())
+            self._cache_assets(all_paths)
+            self._cache_NFO_files(roms)
+            self._prefetch_candidates(roms)
             
-            # ~~~ Check if user pressed the cancel button ~~~
-            if self.pdialog.isCanceled():
-                self.pdialog.endProgress()
-                self.logger.info('User pressed Cancel button when scraping ROMs. ROM scraping stopped.')
-                if kodi.dialog_yesno('Stopping ROM scraping. Store currently scraped items anyway?'):
-                    return roms
-                return None
+            # Redrawing the progress dialog for every ROM is expensive with fast (cached) scrapes.
+            # Only update it every PROGRESS_UPDATE_INTERVAL seconds, unless in verbose mode.
+            last_progress_update = 0.0
+            for rom in roms:
+                ROM_name = rom.get_identifier()
+                now = time.monotonic()
+                if self.pdialog_verbose or now - last_progress_update >= ScrapeStrategy.PROGRESS_UPDATE_INTERVAL:
+                    self.pdialog.updateProgress(num_items_checked, f'Scraping ROM {ROM_name}...')
+                    last_progress_update = now
+                num_items_checked = num_items_checked + 1
+                try:
+                    self._process_ROM(rom)
+                except Exception:
+                    self.logger.exception('Could not scrape "%s"', ROM_name)
+                    kodi.notify_warn(f'Could not scrape "{ROM_name}"')
+                
+                # ~~~ Check if user pressed the cancel button ~~~
+                if self.pdialog.isCanceled():
+                    canceled = True
+                    break
+        finally:
+            self._wait_for_downloads()
+            self.pdialog.endProgress()
+            self.candidate_loader.close()
+            self.http_session.close()
+            self._close_search_results_caches()
+            self._clear_ROM_name_caches()
         
-        self.pdialog.endProgress()
+        if canceled:
+            self.logger.info('User pressed Cancel button when scraping ROMs. ROM scraping stopped.')
+            if not kodi.dialog_yesno('Stopping ROM scraping. Store currently scraped items anyway?'):
+                return None
         return roms
     
     def process_single_rom(self, rom_id: str) -> ROMObj:
@@ -372,20 +710,19 @@ class ScrapeStrategy(object):
         try:
             self._process_ROM(rom)
         except Exception:
-            self.logger.exception(f'Could not scrape "{ROM_name}"')
+            self.logger.exception('Could not scrape "%s"', ROM_name)
             kodi.notify_warn(f'Could not scrape "{ROM_name}"')
             return None
+        finally:
+            self._wait_for_downloads()
+            self.http_session.close()
+            self._close_search_results_caches()
         
         return rom
     
     def _process_ROM(self, rom: ROMObj):
         self.logger.debug('ScrapeStrategy._process_ROM() Determining metadata and asset actions...')
-                        
-        if self.scraper_settings.scrape_metadata_policy != constants.SCRAPE_ACTION_NONE:
-            self._process_ROM_metadata_begin(rom)
-        
-        if self.scraper_settings.scrape_assets_policy != constants.SCRAPE_ACTION_NONE:
-            self._process_ROM_assets_begin(rom)
+        candidate_scraper_objs = self._get_candidate_scrapers(rom)
 
         # --- If metadata or any asset is scraped then select the game among the candidates ---
         # Note that the metadata and asset scrapers may be different. If so, candidates
@@ -396,42 +733,133 @@ class ScrapeStrategy(object):
         # set internally in the scraper object. Unless candidate selection was skipped for metadata.
         status_dic = kodi.new_status_dic('No error')
 
-        ROM_path = rom.get_scanned_data_element_as_file('file')
-        if ROM_path:
-            search_term = text.format_ROM_name_for_scraping(ROM_path.getBaseNoExt())
-        else:
-            search_term = rom.get_name()
-            
+        search_term = self._get_search_term(rom)
         if self.scraper_settings.search_term_mode == constants.SCRAPE_MANUAL:
             search_term = kodi.dialog_keyboard('Search term', search_term)
             
         self.logger.debug('ScrapeStrategy._process_ROM() Getting candidates for game')
-        meta_candidate_set = False
-        if self.scraper_settings.scrape_metadata_policy != constants.SCRAPE_ACTION_NONE:
-            if self.metadata_action == ScrapeStrategy.ACTION_META_SCRAPER:
-                self._get_candidate(rom, search_term, self.meta_scraper_obj, status_dic)
-                meta_candidate_set = True
-        
-        asset_candidate_set = False
-        if self.scraper_settings.scrape_assets_policy != constants.SCRAPE_ACTION_NONE:
-            if self.meta_and_asset_scraper_same and meta_candidate_set:
-                self.logger.debug('Asset candidate game same as metadata candidate. Doing nothing.')
-                asset_candidate_set = True
-            else:
-                self._get_candidate(rom, search_term, self.asset_scraper_obj, status_dic)
-                asset_candidate_set = True
+        for scraper_obj in candidate_scraper_objs:
+            self._get_candidate(rom, search_term, scraper_obj, status_dic)
                 
-        if not meta_candidate_set:
+        if self.meta_scraper_obj not in candidate_scraper_objs:
             self.logger.debug('Metadata candidate game is not set')
-        if not asset_candidate_set:
+        if self.asset_scraper_obj not in candidate_scraper_objs:
             self.logger.debug('Asset candidate game is not set')
             
         if self.scraper_settings.scrape_metadata_policy != constants.SCRAPE_ACTION_NONE:
             self._process_ROM_metadata(rom)
         
-        if self.scraper_settings.scrape_assets_policy != constants.SCRAPE_ACTION_NONE:
+        if self.scraper_settings.scrape_assets_policy != constants.SCRAPE_ACTION_NONE and self.any_asset_work:
             self._process_ROM_assets(rom)
                  
+    # Determines the metadata and asset actions of the ROM. Returns the scrapers to get the
+    # candidate game with: the metadata scraper if it is used and the asset scraper if there
+    # is asset work. If both scrapers are the same the candidate is searched once.
+    def _get_candidate_scrapers(self, rom: ROMObj) -> typing.List[Scraper]:
+        scraper_objs = []
+        if self.scraper_settings.scrape_metadata_policy != constants.SCRAPE_ACTION_NONE:
+            self._process_ROM_metadata_begin(rom)
+            if self.metadata_action == ScrapeStrategy.ACTION_META_SCRAPER:
+                scraper_objs.append(self.meta_scraper_obj)
+        
+        if self.scraper_settings.scrape_assets_policy != constants.SCRAPE_ACTION_NONE:
+            self._process_ROM_assets_begin(rom)
+            if self.any_asset_work and self.asset_scraper_obj not in scraper_objs:
+                scraper_objs.append(self.asset_scraper_obj)
+        return scraper_objs
+
+    def _get_search_term(self, rom: ROMObj) -> str:
+        ROM_path = rom.get_scanned_data_element_as_file('file')
+        if ROM_path:
+            return text.format_ROM_name_for_scraping(ROM_path.getBaseNoExt())
+        return rom.get_name()
+
+    # Looks up the candidates cache of the scrapers once for all the ROMs. Then searches the
+    # candidates of the ROMs not in the candidates cache in batches or ahead, for the scrapers
+    # that support it. Searching is not possible when the user enters the search terms.
+    def _prefetch_candidates(self, roms: typing.List[ROMObj]):
+        self.candidate_loader = CandidateLoader()
+        self.cached_candidates = {}
+        
+        scraper_objs = []
+        if self.metadata_policy_actions is not None and ScrapeStrategy.ACTION_META_SCRAPER in self.metadata_policy_actions:
+            scraper_objs.append(self.meta_scraper_obj)
+        if self.scraper_settings.scrape_assets_policy != constants.SCRAPE_ACTION_NONE and self.asset_scraper_obj not in scraper_objs:
+            scraper_objs.append(self.asset_scraper_obj)
+        
+        rom_identifiers_by_platform = {}
+        for rom in roms:
+            rom_identifiers_by_platform.setdefault(rom.get_platform(), []).append(rom.get_identifier())
+        # (rom, scrapers _process_ROM() gets the candidate with) tuples, determined once.
+        rom_candidate_scrapers = None
+        
+        # Prefetching only saves time. On errors the ROMs are scraped one by one, which
+        # reports the errors per ROM.
+        for scraper_obj in scraper_objs:
+            cached_candidates = {}
+            for platform, rom_identifiers in rom_identifiers_by_platform.items():
+                try:
+                    found = scraper_obj.get_cached_candidates(rom_identifiers, platform)
+                except Exception:
+                    self.logger.exception('Cannot read the candidates cache of %s for %s', scraper_obj.get_name(), platform)
+                    continue
+                cached_candidates.update(((rom_identifier, platform), candidate) for rom_identifier, candidate in found.items())
+            self.cached_candidates[scraper_obj] = cached_candidates
+            if cached_candidates and scraper_obj.supports_bulk():
+                self._prefetch_bulk(scraper_obj, cached_candidates)
+            
+            if self.scraper_settings.search_term_mode == constants.SCRAPE_MANUAL:
+                continue
+            if not scraper_obj.supports_candidates_batch() and not scraper_obj.supports_concurrent_search():
+                continue
+            if rom_candidate_scrapers is None:
+                rom_candidate_scrapers = [(rom, self._get_prefetch_candidate_scrapers(rom)) for rom in roms]
+            search_items = self._get_search_items(scraper_obj, rom_candidate_scrapers, cached_candidates)
+            try:
+                if scraper_obj.supports_candidates_batch():
+                    self.candidate_loader.prefetch(scraper_obj, search_items)
+                else:
+                    self.candidate_loader.read_ahead(scraper_obj, search_items)
+            except Exception:
+                self.logger.exception('Searching candidates ahead with %s failed', scraper_obj.get_name())
+
+    def _get_prefetch_candidate_scrapers(self, rom: ROMObj) -> typing.List[Scraper]:
+        try:
+            return self._get_candidate_scrapers(rom)
+        except Exception:
+            self.logger.exception('Cannot determine the actions of "%s". Not searched ahead.', rom.get_identifier())
+            return []
+
+    # Returns the (search_term, rom, platform) tuples of the ROMs _process_ROM() searches with
+    # the scraper, so no API requests are spent on ROMs which are not searched, e.g. ROMs with
+    # a NFO file or without asset work.
+    def _get_search_items(self, scraper_obj: Scraper, rom_candidate_scrapers: list, cached_candidates: dict) -> list:
+        search_items = []
+        for rom, candidate_scraper_objs in rom_candidate_scrapers:
+            if scraper_obj not in candidate_scraper_objs:
+                continue
+            if (rom.get_identifier(), rom.get_platform()) in cached_candidates:
+                continue
+            search_items.append((self._get_search_term(rom), rom, rom.get_platform()))
+        return search_items
+
+    # Lets the scraper get the metadata and assets of the already known candidates with
+    # as few requests as possible before the ROMs are scraped one by one.
+    def _prefetch_bulk(self, scraper_obj: Scraper, cached_candidates: dict):
+        candidates_by_platform = {}
+        for (rom_identifier, platform), candidate in cached_candidates.items():
+            candidates_by_platform.setdefault(platform, {})[rom_identifier] = candidate
+        
+        for platform, candidates in candidates_by_platform.items():
+            status_dic = kodi.new_status_dic('No error')
+            try:
+                scraper_obj.get_candidates_bulk(candidates, platform, status_dic)
+            except Exception:
+                self.logger.exception('Bulk prefetch with %s failed', scraper_obj.get_name())
+                continue
+            if not status_dic['status']:
+                self.logger.warning('Bulk prefetch with %s failed: %s', scraper_obj.get_name(), status_dic['msg'])
+
     # Called by the ROM scanner. Fills in the ROM metadata.
     #
     # @param ROM: [Rom] ROM object.
@@ -453,9 +881,11 @@ class ScrapeStrategy(object):
                 NFO_file = io.FileName(ROM_path.getPathNoExt() + '.nfo')
             else:
                 NFO_file = io.FileName(rom.get_identifier() + '.nfo')
+            # The NFO file may have been found with a different case, e.g. *.NFO.
+            NFO_file = self._find_NFO_file(NFO_file) or NFO_file
         
             if self.pdialog_verbose:
-                self.pdialog.updateMessage('Loading NFO file {0}'.format(self.NFO_file.getPath()))
+                self.pdialog.updateMessage('Loading NFO file {0}'.format(NFO_file.getPath()))
             rom.update_with_nfo_file(NFO_file)
 
         elif self.metadata_action == ScrapeStrategy.ACTION_META_SCRAPER:
@@ -469,50 +899,83 @@ class ScrapeStrategy(object):
     def _process_ROM_assets(self, rom: ROMObj):
         self.logger.debug('Processing asset actions...')
         
-        if all(asset_action == ScrapeStrategy.ACTION_ASSET_NONE for asset_action in self.asset_action_list.values()):
-            return
-        
+        ACTION_ASSET_NONE = ScrapeStrategy.ACTION_ASSET_NONE
+        ACTION_ASSET_LOCAL_ASSET = ScrapeStrategy.ACTION_ASSET_LOCAL_ASSET
+        ACTION_ASSET_SCRAPER = ScrapeStrategy.ACTION_ASSET_SCRAPER
+        overwrite_existing_assets = self.scraper_settings.overwrite_existing_assets
+        scrap_ROM_asset = self._scrap_ROM_asset
+        logger = self.logger
+        # File name of the scraped assets, the same for all the assets of the ROM.
+        asset_basename = text.str_to_filename_str(rom.get_identifier())
+
         # --- Process asset by asset actions ---
         # --- Asset scraping ---
-        for asset_id in self.scraper_settings.asset_IDs_to_scrape:
+        for asset_id, asset_action, local_asset in self.asset_work:
             asset_name = asset_id.capitalize()
-            if self.asset_action_list[asset_id] == ScrapeStrategy.ACTION_ASSET_NONE:
-                self.logger.debug(f'Skipping asset scraping for {asset_name}')
+            if asset_action == ACTION_ASSET_NONE:
+                logger.debug('Skipping asset scraping for %s', asset_name)
                 continue    
-            elif not self.scraper_settings.overwrite_existing_assets and rom.has_asset(asset_id):
-                self.logger.debug(f'Asset {asset_name} already exists. Skipping (no overwrite)')
+            elif not overwrite_existing_assets and rom.has_asset(asset_id):
+                logger.debug('Asset %s already exists. Skipping (no overwrite)', asset_name)
                 continue
-            elif self.asset_action_list[asset_id] == ScrapeStrategy.ACTION_ASSET_LOCAL_ASSET:
-                self.logger.debug(f'Using local asset for {asset_name}')
-                local_asset = self.local_asset_list[asset_id]
+            elif asset_action == ACTION_ASSET_LOCAL_ASSET:
+                logger.debug('Using local asset for %s', asset_name)
                 if local_asset:
                     rom.set_asset(asset_id, local_asset.getPath())
-            elif self.asset_action_list[asset_id] == ScrapeStrategy.ACTION_ASSET_SCRAPER:
-                asset_path = self._scrap_ROM_asset(asset_id, self.local_asset_list[asset_id], rom)
+            elif asset_action == ACTION_ASSET_SCRAPER:
+                asset_path = scrap_ROM_asset(asset_id, local_asset, rom, asset_basename)
                 if asset_path is None:
-                    self.logger.debug(f'No asset scraped. Skipping {asset_name}')
+                    logger.debug('No asset scraped. Skipping %s', asset_name)
                     continue
                 rom.set_asset(asset_id, asset_path.getPath())
             else:
-                raise ValueError(f'Asset ID {asset_id} unknown action {self.asset_action_list[asset_id]}')
+                raise ValueError(f'Asset ID {asset_id} unknown action {asset_action}')
 
-        romdata = rom.get_data_dic()
         # --- Print some debug info ---
-        self.logger.debug('Set Title     file "{}"'.format(romdata['assets'][constants.ASSET_TITLE_ID]))
-        self.logger.debug('Set Snap      file "{}"'.format(romdata['assets'][constants.ASSET_SNAP_ID]))
-        self.logger.debug('Set Boxfront  file "{}"'.format(romdata['assets'][constants.ASSET_BOXFRONT_ID]))
-        self.logger.debug('Set Boxback   file "{}"'.format(romdata['assets'][constants.ASSET_BOXBACK_ID]))
-        self.logger.debug('Set Cartridge file "{}"'.format(romdata['assets'][constants.ASSET_CARTRIDGE_ID]))
-        self.logger.debug('Set Fanart    file "{}"'.format(romdata['assets'][constants.ASSET_FANART_ID]))
-        self.logger.debug('Set Banner    file "{}"'.format(romdata['assets'][constants.ASSET_BANNER_ID]))
-        self.logger.debug('Set Clearlogo file "{}"'.format(romdata['assets'][constants.ASSET_CLEARLOGO_ID]))
-        self.logger.debug('Set Flyer     file "{}"'.format(romdata['assets'][constants.ASSET_FLYER_ID]))
-        self.logger.debug('Set Map       file "{}"'.format(romdata['assets'][constants.ASSET_MAP_ID]))
-        self.logger.debug('Set Manual    file "{}"'.format(romdata['assets'][constants.ASSET_MANUAL_ID]))
-        self.logger.debug('Set Trailer   file "{}"'.format(romdata['assets'][constants.ASSET_TRAILER_ID]))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                'Set Title     file "%s"\n'
+                'Set Snap      file "%s"\n'
+                'Set Boxfront  file "%s"\n'
+                'Set Boxback   file "%s"\n'
+                'Set Cartridge file "%s"\n'
+                'Set Fanart    file "%s"\n'
+                'Set Banner    file "%s"\n'
+                'Set Clearlogo file "%s"\n'
+                'Set Flyer     file "%s"\n'
+                'Set Map       file "%s"\n'
+                'Set Manual    file "%s"\n'
+                'Set Trailer   file "%s"',
+                rom.get_asset(constants.ASSET_TITLE_ID), rom.get_asset(constants.ASSET_SNAP_ID),
+                rom.get_asset(constants.ASSET_BOXFRONT_ID), rom.get_asset(constants.ASSET_BOXBACK_ID),
+                rom.get_asset(constants.ASSET_CARTRIDGE_ID), rom.get_asset(constants.ASSET_FANART_ID),
+                rom.get_asset(constants.ASSET_BANNER_ID), rom.get_asset(constants.ASSET_CLEARLOGO_ID),
+                rom.get_asset(constants.ASSET_FLYER_ID), rom.get_asset(constants.ASSET_MAP_ID),
+                rom.get_asset(constants.ASSET_MANUAL_ID), rom.get_asset(constants.ASSET_TRAILER_ID))
 
         return rom
 
+    # Determines the parts of the metadata and asset actions which only depend on the
+    # configured policies and the scraper capabilities. Called once, the per ROM parts
+    # are determined by _process_ROM_metadata_begin() and _process_ROM_assets_begin().
+    def _prepare_actions(self):
+        # --- Metadata actions ---
+        # Invalid or disabled policies have no actions. Reported when a ROM is processed.
+        metadata_policy = self.scraper_settings.scrape_metadata_policy
+        self.metadata_policy_actions = ScrapeStrategy.METADATA_POLICY_ACTIONS.get(metadata_policy)
+        if metadata_policy in ScrapeStrategy.METADATA_POLICY_DESCRIPTIONS:
+            self.logger.debug('Metadata policy: %s', ScrapeStrategy.METADATA_POLICY_DESCRIPTIONS[metadata_policy])
+
+        # --- Asset actions ---
+        assets_policy = self.scraper_settings.scrape_assets_policy
+        if assets_policy in ScrapeStrategy.ASSETS_POLICY_DESCRIPTIONS:
+            self.logger.debug('Asset policy: %s', ScrapeStrategy.ASSETS_POLICY_DESCRIPTIONS[assets_policy])
+        
+        # Asked once to the scraper, then checking support for an asset is a set lookup.
+        self.supported_asset_IDs = frozenset(
+            asset_id for asset_id in self.scraper_settings.asset_IDs_to_scrape
+            if self.asset_scraper_obj.supports_asset_ID(asset_id))
+
     # Determine the actions to be carried out by process_ROM_metadata()
     def _process_ROM_metadata_begin(self, rom: ROMObj):
         self.logger.debug('Determining metadata actions...')
@@ -522,7 +985,17 @@ class ScrapeStrategy(object):
             self.metadata_action = ScrapeStrategy.ACTION_META_NONE
             return
         
+        if self.metadata_policy_actions is None:
+            raise ValueError('Invalid scrape_metadata_policy value {0}'.format(self.scraper_settings.scrape_metadata_policy))
+        action_NFO_not_found, action_NFO_found = self.metadata_policy_actions
+
         # --- Determine metadata action ----------------------------------------------------------
+        # Action depends configured metadata policy and wheter the NFO files was found or not.
+        # If the policy does not read NFO files there is no need to test for them.
+        if action_NFO_not_found == action_NFO_found:
+            self.metadata_action = action_NFO_found
+            return
+
         # --- Test if NFO file exists ---  
         ROM_path = rom.get_scanned_data_element_as_file('file')
         if ROM_path:
@@ -530,43 +1003,12 @@ class ScrapeStrategy(object):
         else:
             self.NFO_file = io.FileName(rom.get_identifier() + '.nfo')
         
-        NFO_file_found = True if self.NFO_file.exists() else False
-        if NFO_file_found:
-            self.logger.debug('NFO file found "{0}"'.format(self.NFO_file.getPath()))
+        if self._NFO_file_exists(self.NFO_file):
+            self.logger.debug('NFO file found "%s"', self.NFO_file.getPath())
+            self.metadata_action = action_NFO_found
         else:
-            self.logger.debug('NFO file NOT found "{0}"'.format(self.NFO_file.getPath()))
-
-        # Action depends configured metadata policy and wheter the NFO files was found or not.
-        if self.scraper_settings.scrape_metadata_policy == constants.SCRAPE_POLICY_TITLE_ONLY:
-            self.logger.debug('Metadata policy: Read NFO file OFF | Scraper OFF')
-            self.logger.debug('Metadata policy: Only cleaning ROM name.')
-            self.metadata_action = ScrapeStrategy.ACTION_META_TITLE_ONLY
-
-        elif self.scraper_settings.scrape_metadata_policy == constants.SCRAPE_POLICY_LOCAL_ONLY:
-            self.logger.debug('Metadata policy: Read NFO file ON | Scraper OFF')
-            if NFO_file_found:
-                self.logger.debug('Metadata policy: NFO file found.')
-                self.metadata_action = ScrapeStrategy.ACTION_META_NFO_FILE
-            else:
-                self.logger.debug('Metadata policy: NFO file not found. Only cleaning ROM name')
-                self.metadata_action = ScrapeStrategy.ACTION_META_TITLE_ONLY
-
-        elif self.scraper_settings.scrape_metadata_policy == constants.SCRAPE_POLICY_LOCAL_AND_SCRAPE:
-            self.logger.debug('Metadata policy: Read NFO file ON | Scraper ON')
-            if NFO_file_found:
-                self.logger.debug('Metadata policy: NFO file found. Scraper not used.')
-                self.metadata_action = ScrapeStrategy.ACTION_META_NFO_FILE
-            else:
-                self.logger.debug('Metadata policy: NFO file not found. Using scraper.')
-                self.metadata_action = ScrapeStrategy.ACTION_META_SCRAPER
-
-        elif self.scraper_settings.scrape_metadata_policy == constants.SCRAPE_POLICY_SCRAPE_ONLY:
-            self.logger.debug('Metadata policy: Read NFO file OFF | Scraper ON')
-            self.logger.debug('Metadata policy: Using metadata scraper {}'.format(self.meta_scraper_obj.get_name()))
-            self.metadata_action = ScrapeStrategy.ACTION_META_SCRAPER
-
-        else:
-            raise ValueError('Invalid scrape_metadata_policy value {0}'.format(self.scraper_settings.scrape_metadata_policy))
+            self.logger.debug('NFO file NOT found "%s"', self.NFO_file.getPath())
+            self.metadata_action = action_NFO_not_found
   
     # Determine the actions to be carried out by _process_ROM_assets()
     def _process_ROM_assets_begin(self, rom: ROMObj):
@@ -575,8 +1017,15 @@ class ScrapeStrategy(object):
         if self.asset_scraper_obj is None:
             self.logger.debug('No asset scraper set, disabling asset scraping.')
             self.asset_action_list = {asset_id: ScrapeStrategy.ACTION_ASSET_NONE for asset_id in self.scraper_settings.asset_IDs_to_scrape}
+            self.asset_work = tuple((asset_id, ScrapeStrategy.ACTION_ASSET_NONE, None)
+                                    for asset_id in self.scraper_settings.asset_IDs_to_scrape)
+            self.any_asset_work = False
             return
         
+        assets_policy = self.scraper_settings.scrape_assets_policy
+        if assets_policy not in ScrapeStrategy.ASSETS_POLICY_ACTIONS:
+            raise ValueError('Invalid scrape_assets_policy value {0}'.format(assets_policy))
+
         # --- Determine Asset action -------------------------------------------------------------
         # --- Search for local artwork/assets ---
         # Always look for local assets whatever the scanner settings. For unconfigured assets
@@ -584,68 +1033,41 @@ class ScrapeStrategy(object):
         self.local_asset_list = self._get_local_assets(rom, self.scraper_settings.asset_IDs_to_scrape) 
         self.asset_action_list = {}
         
-        # Print information to the log
-        if self.scraper_settings.scrape_assets_policy == constants.SCRAPE_POLICY_LOCAL_ONLY:
-            self.logger.debug('Asset policy: Local images ON | Scraper OFF')
-        elif self.scraper_settings.scrape_assets_policy == constants.SCRAPE_POLICY_LOCAL_AND_SCRAPE:
-            self.logger.debug('Asset policy: Local images ON | Scraper ON')
-        elif self.scraper_settings.scrape_assets_policy == constants.SCRAPE_POLICY_SCRAPE_ONLY:
-            self.logger.debug('Asset policy: Local images OFF | Scraper ON')
-        else:
-            raise ValueError('Invalid scrape_assets_policy value {0}'.format(self.scraper_settings.scrape_assets_policy))
         # Process asset by asset (only enabled ones)
+        policy_actions = ScrapeStrategy.ASSETS_POLICY_ACTIONS[assets_policy]
+        overwrite_existing_assets = self.scraper_settings.overwrite_existing_assets
+        log_actions = self.logger.isEnabledFor(logging.DEBUG)
         for asset_info_id in self.scraper_settings.asset_IDs_to_scrape:
-            # Local artwork.
-            if not self.scraper_settings.overwrite_existing_assets and rom.has_asset(asset_info_id):
-                self.logger.debug(f'ROM has {asset_info_id} assigned. Overwrite existing disabled.')
-                self.asset_action_list[asset_info_id] = ScrapeStrategy.ACTION_ASSET_NONE
-            elif self.scraper_settings.scrape_assets_policy == constants.SCRAPE_POLICY_LOCAL_ONLY:
-                if self.local_asset_list[asset_info_id]:
-                    self.logger.debug(f'Local {asset_info_id} FOUND')
-                else:
-                    self.logger.debug(f'Local {asset_info_id} NOT found.')
-                self.asset_action_list[asset_info_id] = ScrapeStrategy.ACTION_ASSET_LOCAL_ASSET
-            # Local artwork + Scrapers.
-            elif self.scraper_settings.scrape_assets_policy == constants.SCRAPE_POLICY_LOCAL_AND_SCRAPE:
-                if self.local_asset_list[asset_info_id]:
-                    self.logger.debug('Local {0} FOUND'.format(asset_info_id))
-                    self.asset_action_list[asset_info_id] = ScrapeStrategy.ACTION_ASSET_LOCAL_ASSET
-                elif self.asset_scraper_obj.supports_asset_ID(asset_info_id):
-                    # Scrape only if scraper supports asset.
-                    self.logger.debug('Local {0} NOT found. Scraping.'.format(asset_info_id))
-                    self.asset_action_list[asset_info_id] = ScrapeStrategy.ACTION_ASSET_SCRAPER
-                else:
-                    self.logger.debug('Local {0} NOT found. No scraper support.'.format(asset_info_id))
-                    self.asset_action_list[asset_info_id] = ScrapeStrategy.ACTION_ASSET_LOCAL_ASSET
-            # Scrapers.
-            elif self.scraper_settings.scrape_assets_policy == constants.SCRAPE_POLICY_SCRAPE_ONLY:
-                # Scraper does not support asset but local asset found.
-                if not self.asset_scraper_obj.supports_asset_ID(asset_info_id) and self.local_asset_list[asset_info_id]:
-                    self.logger.debug('Scraper {} does not support {}. Using local asset.'.format(
-                        self.asset_scraper_obj.get_name(), asset_info_id))
-                    self.asset_action_list[asset_info_id] = ScrapeStrategy.ACTION_ASSET_LOCAL_ASSET
-                # Scraper does not support asset and local asset not found.
-                elif not self.asset_scraper_obj.supports_asset_ID(asset_info_id) and not self.local_asset_list[asset_info_id]:
-                    self.logger.debug('Scraper {} does not support {}. Local asset not found.'.format(
-                        self.asset_scraper_obj.get_name(), asset_info_id))
-                    self.asset_action_list[asset_info_id] = ScrapeStrategy.ACTION_ASSET_LOCAL_ASSET
-                # Scraper supports asset. Scrape wheter local asset is found or not.
-                elif self.asset_scraper_obj.supports_asset_ID(asset_info_id):
-                    self.logger.debug('Scraping {} with {}.'.format(asset_info_id, self.asset_scraper_obj.get_name()))
-                    self.asset_action_list[asset_info_id] = ScrapeStrategy.ACTION_ASSET_SCRAPER
-                else:
-                    raise ValueError('Logical error')
+            scraper_supports_asset = asset_info_id in self.supported_asset_IDs
+            local_asset_found = bool(self.local_asset_list[asset_info_id])
+            if not overwrite_existing_assets and rom.has_asset(asset_info_id):
+                asset_action = ScrapeStrategy.ACTION_ASSET_NONE
+            else:
+                asset_action = policy_actions[scraper_supports_asset << 1 | local_asset_found]
+            self.asset_action_list[asset_info_id] = asset_action
+            if log_actions:
+                self.logger.debug('%s: local asset %s, scraper support %s. Action: %s',
+                                  asset_info_id, 'FOUND' if local_asset_found else 'NOT found',
+                                  'Yes' if scraper_supports_asset else 'No',
+                                  ScrapeStrategy.ASSET_ACTION_DESCRIPTIONS[asset_action])
+
+        # Per ROM work list for _process_ROM_assets(): (asset ID, action, local asset) tuples.
+        self.asset_work = tuple((asset_id, self.asset_action_list[asset_id], self.local_asset_list[asset_id])
+                                for asset_id in self.scraper_settings.asset_IDs_to_scrape)
+        asset_actions = self.asset_action_list.values()
+        self.any_asset_work = ScrapeStrategy.ACTION_ASSET_LOCAL_ASSET in asset_actions or \
+            ScrapeStrategy.ACTION_ASSET_SCRAPER in asset_actions
 
     # Get a candidate game in the ROM scanner.
     # Returns nothing.
     def _get_candidate(self, rom: ROMObj, search_term: str, scraper_obj: Scraper, status_dic):
+        scraper_name = scraper_obj.get_name()
         # --- Update scanner progress dialog ---
         if self.pdialog_verbose:
-            scraper_text = 'Searching games with scraper {}...'.format(scraper_obj.get_name())
-            self.pdialog.updateMessage(scraper_text)
+            self.pdialog.updateMessage(f'Searching games with scraper {scraper_name}...')
         
         rom_platform = rom.get_platform()
-        self.logger.debug('Searching games with scraper {} for platform {}'.format(scraper_obj.get_name(), rom_platform))
+        self.logger.debug('Searching games with scraper %s for platform %s', scraper_name, rom_platform)
 
         # * The scanner uses the cached ROM candidate always.
         # * If the candidate is empty it means it was previously searched and the scraper
@@ -653,16 +1075,24 @@ class ScrapeStrategy(object):
         #   change the search string and set a valid candidate.
         rom_identifier = rom.get_identifier()
         
-        if scraper_obj.check_candidates_cache(rom_identifier, rom_platform):
-            self.logger.debug('ROM "{}" in candidates cache.'.format(rom_identifier))
+        # Candidates found by _prefetch_candidates() are a dictionary lookup. ROMs not found
+        # there may have been added to the cache during this scan, so still check the cache.
+        cached_candidates = self.cached_candidates.get(scraper_obj, {})
+        if (rom_identifier, rom_platform) in cached_candidates:
+            self.logger.debug('ROM "%s" in candidates cache.', rom_identifier)
+            if not cached_candidates[(rom_identifier, rom_platform)]:
+                self.logger.debug('Candidate game is empty. ROM will not be scraped again by the scanner.')
+            use_from_cache = True
+        elif scraper_obj.check_candidates_cache(rom_identifier, rom_platform):
+            self.logger.debug('ROM "%s" in candidates cache.', rom_identifier)
             candidate = scraper_obj.retrieve_from_candidates_cache(rom_identifier, rom_platform)
             if not candidate:
                 self.logger.debug('Candidate game is empty. ROM will not be scraped again by the scanner.')
             use_from_cache = True
         else:
-            self.logger.debug('ROM "{}" NOT in candidates cache.'.format(rom_identifier))
+            self.logger.debug('ROM "%s" NOT in candidates cache.', rom_identifier)
             use_from_cache = False
-        self.logger.debug('use_from_cache "{}"'.format(use_from_cache))
+        self.logger.debug('use_from_cache "%s"', use_from_cache)
 
         if use_from_cache:
             scraper_obj.set_candidate_from_cache(rom_identifier, rom_platform)
@@ -671,25 +1101,15 @@ class ScrapeStrategy(object):
             scraper_obj.clear_cache(rom_identifier, rom_platform)
 
             # --- Call scraper and get a list of games ---                
-            candidates = scraper_obj.get_candidates(search_term, rom, rom_platform, status_dic)
+            candidates = self.candidate_loader.load(scraper_obj, search_term, rom, rom_platform, status_dic)
             # * If the scraper produced an error notification show it and continue scanner operation.
             # * Note that if many errors/exceptions happen (for example, network is down) then
             #   the scraper will disable itself after a number of errors and only a limited number
             #   of messages will be displayed.
             # * In the scanner treat any scraper error message as a Kodi OK dialog.
             # * Once the error is displayed reset status_dic
-            if not status_dic['status']:
-                if status_dic['dialog'] == kodi.KODI_MESSAGE_CANCEL:
-                    self.pdialog.cancel()
-                    return
-                self.pdialog.close()
-                # Close error message dialog automatically 1 minute to keep scanning.
-                yesno_msg = f"{status_dic['msg']}\nStop scraping?"
-                if kodi.dialog_yesno_timer(yesno_msg, 60000):
-                    status_dic['dialog'] = kodi.KODI_MESSAGE_CANCEL
-                    return
-                status_dic = kodi.new_status_dic('No error')
-                self.pdialog.reopen()
+            if self._report_scraper_error(status_dic):
+                return
             # * If candidates is None some kind of error/exception happened.
             # * None is also returned if the scraper is disabled (also no error in status_dic).
             # * Set the candidate to None in the scraper object so later calls to get_metadata()
@@ -705,9 +1125,9 @@ class ScrapeStrategy(object):
             # * dictionary and introduce it in the cache.
             if not candidates:
                 self.logger.debug('Found no candidates after searching.')
-                scraper_obj.set_candidate(rom_identifier, rom_platform, dict())
+                scraper_obj.set_candidate(rom_identifier, rom_platform, {})
                 return
-            self.logger.debug('Scraper {} found {} candidate/s'.format(scraper_obj.get_name(), len(candidates)))
+            self.logger.debug('Scraper %s found %s candidate/s', scraper_name, len(candidates))
 
             # --- Choose game to download metadata ---
             if self.scraper_settings.game_selection_mode == constants.SCRAPE_MANUAL:
@@ -737,6 +1157,25 @@ class ScrapeStrategy(object):
             # --- Set candidate. This will introduce it in the cache ---
             scraper_obj.set_candidate(rom_identifier, rom_platform, candidate)
 
+    # Shows the error reported by a scraper in status_dic, if any. The error dialog closes
+    # automatically after 1 minute to keep scanning. status_dic is reset after the error
+    # is shown so the next scraper calls start with a clean status.
+    # Returns True if the current scraping step must be stopped.
+    def _report_scraper_error(self, status_dic) -> bool:
+        if status_dic['status']:
+            return False
+        if status_dic['dialog'] == kodi.KODI_MESSAGE_CANCEL:
+            self.pdialog.cancel()
+            return True
+
+        self.pdialog.close()
+        if kodi.dialog_yesno_timer(f"{status_dic['msg']}\nStop scraping?", 60000):
+            status_dic['dialog'] = kodi.KODI_MESSAGE_CANCEL
+            return True
+        status_dic.update(kodi.new_status_dic('No error'))
+        self.pdialog.reopen()
+        return False
+
     # Scraps ROM metadata in the ROM scanner.
     def _scrap_ROM_metadata(self, rom: ROMObj):
         self.logger.debug('ScrapeStrategy._scanner_scrap_ROM_metadata() Scraping metadata...')
@@ -760,21 +1199,11 @@ class ScrapeStrategy(object):
         status_dic = kodi.new_status_dic('No error')
         game_data = self.meta_scraper_obj.get_metadata(status_dic)
         if not status_dic['status']:
-            if status_dic['dialog'] == kodi.KODI_MESSAGE_CANCEL:
-                self.pdialog.cancel()
-                return
-
-            self.pdialog.close()
-            # Close error message dialog automatically 1 minute to keep scanning.
-            yesno_msg = f"{status_dic['msg']}\nStop scraping?"
-            if kodi.dialog_yesno_timer(yesno_msg, 60000):
-                status_dic['dialog'] = kodi.KODI_MESSAGE_CANCEL
-                return
-            self.pdialog.reopen()
+            self._report_scraper_error(status_dic)
             return
 
         scraper_applied = self._apply_candidate_on_metadata(game_data, rom)
-        self.logger.debug(f"Scraper applied? {scraper_applied}")
+        self.logger.debug("Scraper applied? %s", scraper_applied)
         
     #
     # Returns a valid filename of the downloaded scrapped image, filename of local image
@@ -783,99 +1212,85 @@ class ScrapeStrategy(object):
     # @param asset_info_id [str]
     # @param local_asset_path: [FileName]
     # @param rom: [Rom object]
+    # @param asset_basename: [str] File name without extension of the scraped asset.
     # @return: [str] Filename string with the asset path.
-    def _scrap_ROM_asset(self, asset_info_id: str, local_asset_path: io.FileName, rom: ROMObj):
+    def _scrap_ROM_asset(self, asset_info_id: str, local_asset_path: io.FileName, rom: ROMObj, asset_basename: str):
         # --- Cached frequent used things ---
-        asset_dir_FN = rom.get_asset_path(asset_info_id)
-        asset_path_noext_FN = asset_dir_FN + text.str_to_filename_str(rom.get_identifier())
         asset_name = asset_info_id.capitalize()
+        asset_scraper_obj = self.asset_scraper_obj
+        pdialog = self.pdialog
+        scraper_name = asset_scraper_obj.get_name()
        
-        t = 'Scraping {} with scraper {} ------------------------------'
-        self.logger.debug(t.format(asset_info_id, self.asset_scraper_obj.get_name()))
+        self.logger.debug('Scraping %s with scraper %s ------------------------------', asset_info_id, scraper_name)
         status_dic = kodi.new_status_dic('No error')
         
         # By default always use local image if found in case scraper fails.
         ret_asset_path = local_asset_path
-        self.logger.debug('local_asset_path "{}"'.format(local_asset_path))
-        self.logger.debug('asset_path_noext "{}"'.format(asset_path_noext_FN.getPath()))
+        self.logger.debug('local_asset_path "%s"', local_asset_path)
 
         # --- If no candidates available just clean the ROM Title and return ---
-        if self.asset_scraper_obj.candidate is None:
+        if asset_scraper_obj.candidate is None:
             self.logger.debug('Asset candidate is None (previous error). Doing nothing.')
             return ret_asset_path
-        if not self.asset_scraper_obj.candidate:
+        if not asset_scraper_obj.candidate:
             self.logger.debug('Asset candidate is empty (no candidates found). Doing nothing.')
             return ret_asset_path
 
         # --- If scraper does not support particular asset return inmediately ---
-        if not self.asset_scraper_obj.supports_asset_ID(asset_info_id):
-            self.logger.debug('Scraper {} does not support asset {}.'.format(
-                self.asset_scraper_obj.get_name(), asset_info_id))
+        if asset_info_id not in self.supported_asset_IDs:
+            self.logger.debug('Scraper %s does not support asset %s.', scraper_name, asset_info_id)
             return ret_asset_path
 
         # --- Update scanner progress dialog ---
         if self.pdialog_verbose:
-            scraper_text = 'Getting {} images from {}...'.format(
-                asset_info_id, self.asset_scraper_obj.get_name())
-            self.pdialog.updateMessage(scraper_text)
+            pdialog.updateMessage(f'Getting {asset_info_id} images from {scraper_name}...')
 
         # --- Grab list of images/assets for the selected candidate ---
-        assetdata_list = self.asset_scraper_obj.get_assets(asset_info_id, status_dic)
-        if not status_dic['status']:
-            if status_dic['dialog'] == kodi.KODI_MESSAGE_CANCEL:
-                self.pdialog.cancel()
-                return
-            self.pdialog.close()
-            # Close error message dialog automatically 1 minute to keep scanning.
-            yesno_msg = f"{status_dic['msg']}\nStop scraping?"
-            if kodi.dialog_yesno_timer(yesno_msg, 60000):
-                status_dic['dialog'] = kodi.KODI_MESSAGE_CANCEL
-                return
-            status_dic = kodi.new_status_dic('No error')
-            self.pdialog.reopen()
+        assetdata_list = asset_scraper_obj.get_assets(asset_info_id, status_dic)
+        if self._report_scraper_error(status_dic):
+            return
         if assetdata_list is None or not assetdata_list:
             # If scraper returns no images return current local asset.
-            self.logger.debug('{} {} found no images.'.format(self.asset_scraper_obj.get_name(), asset_info_id))
+            self.logger.debug('%s %s found no images.', scraper_name, asset_info_id)
             return ret_asset_path
         # self.logger.debug('{} scraper returned {} images.'.format(asset_name, len(assetdata_list)))
 
         # --- Semi-automatic scraping (user choses an image from a list) ---
         if self.scraper_settings.asset_selection_mode == constants.SCRAPE_MANUAL:
-            # If there is a local image add it to the list and show it to the user
-            local_asset_in_list_flag = False
-            if local_asset_path:
+            # If there is a local image show it to the user as the first item of the list.
+            local_asset_in_list_flag = bool(local_asset_path)
+            if local_asset_in_list_flag:
                 local_asset = {
                     'asset_ID': asset_info_id,
                     'display_name': 'Current local image',
                     'url_thumb': local_asset_path.getPath(),
                 }
-                assetdata_list.insert(0, local_asset)
-                local_asset_in_list_flag = True
+                selectable_assets = itertools.chain((local_asset,), assetdata_list)
+            else:
+                selectable_assets = assetdata_list
 
             # Convert list returned by scraper into a list the select window uses.
-            ListItem_list = []
-            for item in assetdata_list:
-                listitem_obj = xbmcgui.ListItem(label=item['display_name'], label2=item['url_thumb'])
-                listitem_obj.setArt({'icon': item['url_thumb']})
-                ListItem_list.append(listitem_obj)
+            ListItem_list = [_new_asset_ListItem(item) for item in selectable_assets]
             # ListItem_list has 1 or more elements at this point.
-            # If assetdata_list has only 1 element do not show select dialog. Note that the
-            # length of assetdata_list is 1 only if scraper returned 1 image and a local image
+            # If ListItem_list has only 1 element do not show select dialog. Note that the
+            # length of ListItem_list is 1 only if scraper returned 1 image and a local image
             # does not exist. If the scraper returned no images this point is never reached.
             if len(ListItem_list) == 1:
                 image_selected_index = 0
             else:
-                self.pdialog.close()
+                pdialog.close()
                 image_selected_index = xbmcgui.Dialog().select(
                     'Select {0} asset'.format(asset_name), list=ListItem_list, useDetails=True)
-                self.logger.debug('{0} dialog returned index {1}'.format(asset_info_id, image_selected_index))
+                self.logger.debug('%s dialog returned index %s', asset_info_id, image_selected_index)
                 if image_selected_index < 0:
                     image_selected_index = 0
-                self.pdialog.reopen()
+                pdialog.reopen()
             # User chose to keep current asset.
-            if local_asset_in_list_flag and image_selected_index == 0:
-                self.logger.debug('User chose local asset. Returning.')
-                return ret_asset_path
+            if local_asset_in_list_flag:
+                if image_selected_index == 0:
+                    self.logger.debug('User chose local asset. Returning.')
+                    return ret_asset_path
+                image_selected_index = image_selected_index - 1
         # --- Automatic scraping. Pick first image. ---
         elif self.scraper_settings.asset_selection_mode == constants.SCRAPE_AUTOMATIC:
             image_selected_index = 0
@@ -888,48 +1303,20 @@ class ScrapeStrategy(object):
         # --- Resolve asset URL ---
         self.logger.debug('Resolving asset URL...')
         if self.pdialog_verbose:
-            scraper_text = 'Scraping {0} with {1} (Resolving URL...)'.format(
-                asset_info_id, self.asset_scraper_obj.get_name())
-            self.pdialog.updateMessage(scraper_text)
-        image_url, image_url_log = self.asset_scraper_obj.resolve_asset_URL(
+            scraper_text = f'Scraping {asset_info_id} with {scraper_name} (Resolving URL...)'
+            pdialog.updateMessage(scraper_text)
+        image_url, image_url_log, image_ext = asset_scraper_obj.resolve_asset_URL_and_extension(
             selected_asset, status_dic)
-        if not status_dic['status']:
-            if status_dic['dialog'] == kodi.KODI_MESSAGE_CANCEL:
-                self.pdialog.cancel()
-                return
-            self.pdialog.close()
-            # Close error message dialog automatically 1 minute to keep scanning.
-            yesno_msg = f"{status_dic['msg']}\nStop scraping?"
-            if kodi.dialog_yesno_timer(yesno_msg, 60000):
-                status_dic['dialog'] = kodi.KODI_MESSAGE_CANCEL
-                return
-            status_dic = kodi.new_status_dic('No error')
-            self.pdialog.reopen()
+        if self._report_scraper_error(status_dic):
+            return
         if image_url is None or not image_url:
             self.logger.debug('Error resolving URL')
             return ret_asset_path
-        self.logger.debug('Resolved {0} to URL "{1}"'.format(asset_info_id, image_url_log))
-
-        # --- Resolve URL extension ---
-        self.logger.debug('Resolving asset URL extension...')
-        image_ext = self.asset_scraper_obj.resolve_asset_URL_extension(
-            selected_asset, image_url, status_dic)
-        if not status_dic['status']:
-            if status_dic['dialog'] == kodi.KODI_MESSAGE_CANCEL:
-                self.pdialog.cancel()
-                return
-            self.pdialog.close()
-            # Close error message dialog automatically 1 minute to keep scanning.
-            yesno_msg = f"{status_dic['msg']}\nStop scraping?"
-            if kodi.dialog_yesno_timer(yesno_msg, 60000):
-                status_dic['dialog'] = kodi.KODI_MESSAGE_CANCEL
-                return
-            status_dic = kodi.new_status_dic('No error')
-            self.pdialog.reopen()
+        self.logger.debug('Resolved %s to URL "%s"', asset_info_id, image_url_log)
         if image_ext is None or not image_ext:
-            self.logger.debug('Error resolving URL')
+            self.logger.debug('Error resolving URL extension')
             return ret_asset_path
-        self.logger.debug(f'Resolved URL extension "{image_ext}"')
+        self.logger.debug('Resolved URL extension "%s"', image_ext)
 
         # If remote file is of type 'url', then do not download. Return value directly.
         if image_ext == "url":
@@ -937,22 +1324,28 @@ class ScrapeStrategy(object):
         
         # --- Download image ---
         if self.pdialog_verbose:
-            scraper_text = f'Downloading {asset_info_id} from {self.asset_scraper_obj.get_name()}...'
-            self.pdialog.updateMessage(scraper_text)
+            scraper_text = f'Downloading {asset_info_id} from {scraper_name}...'
+            pdialog.updateMessage(scraper_text)
+        # The asset path is only built when there is something to download.
+        asset_path_noext_FN = rom.get_asset_path(asset_info_id) + asset_basename
+        self.logger.debug('asset_path_noext "%s"', asset_path_noext_FN.getPath())
         image_local_path = asset_path_noext_FN.append('.' + image_ext)
-        self.logger.debug(f'Download  "{image_url_log}"')
-        self.logger.debug(f'Into file "{image_local_path.getPath()}"')
+        self.logger.debug('Download  "%s"', image_url_log)
+        self.logger.debug('Into file "%s"', image_local_path.getPath())
+        if asset_scraper_obj.supports_concurrent_downloads():
+            self._download_image_in_background(image_url, image_local_path, asset_name)
+            return image_local_path
         try:
-            image_local_path = self.asset_scraper_obj.download_image(image_url, image_local_path)
+            image_local_path = asset_scraper_obj.download_image(image_url, image_local_path)
         except Exception:
             self.logger.exception('(Exception) In scraper.download_image.')
-            self.pdialog.close()
+            pdialog.close()
             # Close error message dialog automatically 1 minute to keep scanning.
             if kodi.dialog_yesno_timer(f'Cannot download {asset_name} image (Timeout).\nStop scraping?', 60000):
                 status_dic['msg'] = f'Cannot download {asset_name} image (Timeout)'
                 status_dic['dialog'] = kodi.KODI_MESSAGE_CANCEL
                 return
-            self.pdialog.reopen()
+            pdialog.reopen()
         
         # --- Update Kodi cache with downloaded image ---
         # Recache only if local image is in the Kodi cache, this function takes care of that.
@@ -966,6 +1359,35 @@ class ScrapeStrategy(object):
         # --- Return value is downloaded image ---
         return image_local_path
 
+    # The image path is known before downloading, so the download does not block scraping
+    # the next assets and ROMs. Errors are reported by _wait_for_downloads().
+    def _download_image_in_background(self, image_url, image_local_path: io.FileName, asset_name: str):
+        if self.download_executor is None:
+            self.download_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=ScrapeStrategy.DOWNLOAD_MAX_WORKERS)
+        future = self.download_executor.submit(self.asset_scraper_obj.download_image, image_url, image_local_path)
+        self.download_futures.append((asset_name, image_local_path, future))
+
+    # Waits until all the images downloading in the background are saved.
+    def _wait_for_downloads(self):
+        if self.download_executor is None:
+            return
+        
+        if self.download_futures:
+            self.pdialog.updateMessage('Downloading images...')
+        num_failed = 0
+        for asset_name, image_local_path, future in self.download_futures:
+            try:
+                future.result()
+            except Exception:
+                self.logger.exception('(Exception) Downloading %s image "%s".', asset_name, image_local_path.getPath())
+                num_failed += 1
+        self.download_futures = []
+        self.download_executor.shutdown()
+        self.download_executor = None
+        if num_failed > 0:
+            kodi.notify_warn(f'Cannot download {num_failed} image/s')
+
     # This function to be used in AKL 0.10.x series.
     #
     # @param gamedata: Dictionary with game data.
@@ -980,21 +1402,14 @@ class ScrapeStrategy(object):
         if self.scraper_settings.ignore_scrap_title and rom_file:
             rom_name = text.format_ROM_title(rom_file.getBaseNoExt(), self.scraper_settings.clean_tags)
             rom.set_name(rom_name)
-            self.logger.debug("User wants to ignore scraper name. Setting name to '{0}'".format(rom_name))
+            self.logger.debug("User wants to ignore scraper name. Setting name to '%s'", rom_name)
         else:
             rom_name = gamedata['title']
             rom.set_name(rom_name)
-            self.logger.debug("User wants scrapped name. Setting name to '{0}'".format(rom_name))
-
-        rom.set_releaseyear(gamedata['year'])
-        rom.set_genre(gamedata['genre'])
-        rom.set_developer(gamedata['developer'])
-        rom.set_number_of_players(gamedata['nplayers'])
-        rom.set_number_of_players_online(gamedata['nplayers_online'])
-        rom.set_esrb_rating(gamedata['esrb'])
-        rom.set_pegi_rating(gamedata['pegi'])
-        rom.set_plot(gamedata['plot'])
-        rom.set_tags(gamedata['tags'])
+            self.logger.debug("User wants scrapped name. Setting name to '%s'", rom_name)
+
+        for gamedata_key, setter_name in ScrapeStrategy.METADATA_SETTERS:
+            getattr(rom, setter_name)(gamedata[gamedata_key])
 
         return True
         
@@ -1021,31 +1436,96 @@ class ScrapeStrategy(object):
             asset_path = rom.get_asset_path(asset_info_id)
             if asset_path is None:
                 local_assets[asset_info_id] = None
-                self.logger.warning('Asset Path not defined for ROM {0} asset {1:<9}'.format(rom_identifier, asset_info_id))
+                self.logger.warning('Asset Path not defined for ROM %s asset %-9s', rom_identifier, asset_info_id)
             else:
                 local_asset = io.misc_search_file_cache(asset_path, rom_identifier, search_exts)
                 if local_asset:
                     local_assets[asset_info_id] = local_asset
-                    self.logger.debug('Found    {0:<9} "{1}"'.format(asset_info_id, local_asset))
+                    self.logger.debug('Found    %-9s "%s"', asset_info_id, local_asset)
                 else:
                     local_assets[asset_info_id] = None
-                    self.logger.debug('Missing  {0:<9}'.format(asset_info_id))
+                    self.logger.debug('Missing  %-9s', asset_info_id)
 
         return local_assets
 
+    # Scans all the unique asset directories and adds them to the file cache.
+    # Directory listing is I/O bound, so the directories are scanned concurrently.
     def _cache_assets(self, paths: typing.List[io.FileName]):
-        duplicates = []
+        unique_paths = {}
         for path in paths:
             if path is None:
                 continue
             
             path_str = path.getPath()
-            if path_str in duplicates or path_str == '':
+            if path_str in unique_paths or path_str == '':
                 continue
             
-            self.logger.debug('Caching directory "{}"'.format(path_str))
-            io.misc_add_file_cache(path)
-            duplicates.append(path_str)
+            self.logger.debug('Caching directory "%s"', path_str)
+            unique_paths[path_str] = path
+
+        if not unique_paths:
+            return
+        
+        max_workers = min(ScrapeStrategy.CACHE_ASSETS_MAX_WORKERS, len(unique_paths))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Consume results so exceptions in the workers are raised here.
+            list(executor.map(io.misc_add_file_cache, unique_paths.values()))
+
+    # Lists the NFO files in the directories of the given ROMs once, so checking if a ROM
+    # has an NFO file becomes a set lookup. Only used when the metadata policy reads NFO files.
+    def _cache_NFO_files(self, roms: typing.List[ROMObj]):
+        self.NFO_files_cache = {}
+        if self.metadata_policy_actions is None or self.metadata_policy_actions[0] == self.metadata_policy_actions[1]:
+            return
+        
+        for rom in roms:
+            ROM_path = rom.get_scanned_data_element_as_file('file')
+            if not ROM_path:
+                continue
+            dir_str = ROM_path.getDir()
+            if dir_str in self.NFO_files_cache:
+                continue
+            self._list_NFO_files(dir_str)
+
+    # Lists the NFO files of a directory in NFO_files_cache. Returns None if it cannot be listed.
+    def _list_NFO_files(self, dir_str: str) -> typing.Optional[dict]:
+        try:
+            file_names = io.FileName(dir_str, isdir=True).list()
+        except Exception:
+            self.logger.exception('Cannot list directory "%s"', dir_str)
+            return None
+        # Names are matched lowercased, like misc_add_file_cache() does, to also find *.NFO files.
+        NFO_files = {f.lower(): f for f in file_names if f.lower().endswith('.nfo')}
+        self.NFO_files_cache[dir_str] = NFO_files
+        return NFO_files
+
+    def _NFO_file_exists(self, NFO_file: io.FileName) -> bool:
+        return self._find_NFO_file(NFO_file) is not None
+
+    # Returns the NFO file with the name as found on disk, None if it does not exist.
+    def _find_NFO_file(self, NFO_file: io.FileName) -> typing.Optional[io.FileName]:
+        NFO_files = self.NFO_files_cache.get(NFO_file.getDir())
+        if NFO_files is None:
+            NFO_files = self._list_NFO_files(NFO_file.getDir())
+        if NFO_files is None:
+            return NFO_file if NFO_file.exists() else None
+        file_name = NFO_files.get(NFO_file.getBase().lower())
+        if file_name is None:
+            return None
+        if file_name == NFO_file.getBase():
+            return NFO_file
+        return NFO_file.getDirAsFileName().pjoin(file_name)
+
+    def _close_search_results_caches(self):
+        for scraper_obj in {self.meta_scraper_obj, self.asset_scraper_obj}:
+            if scraper_obj is not None:
+                scraper_obj.close_search_results_cache()
+
+    # The ROM name formatting functions memoize their results. Drop them once a scan is done
+    # so the entries of a big collection do not stay in memory.
+    def _clear_ROM_name_caches(self):
+        text.format_ROM_name_for_scraping.cache_clear()
+        text.format_ROM_title.cache_clear()
 
     def store_scraped_rom(self, scraper_id: str, rom_id: str, rom: ROMObj):
         if rom is None:
@@ -1076,21 +1556,7 @@ class ScrapeStrategy(object):
             kodi.notify_error('Failed to store scraped ROMs')
 
     def _translate(self, key):
-        if key == constants.SCRAPE_ACTION_NONE:
-            return 'No action'
-        if key == constants.SCRAPE_POLICY_TITLE_ONLY:
-            return 'Use title only'
-        if key == constants.SCRAPE_POLICY_LOCAL_ONLY:
-            return 'Use local files only'
-        if key == constants.SCRAPE_POLICY_LOCAL_AND_SCRAPE:
-            return 'Local / Scrape'
-        if key == constants.SCRAPE_POLICY_SCRAPE_ONLY:
-            return 'Scrape only'
-        if key == constants.SCRAPE_MANUAL:
-            return 'Manual selection'
-        if key == constants.SCRAPE_AUTOMATIC:
-            return 'Automatic selection'
-        return key
+        return ScrapeStrategy.SETTING_TRANSLATIONS.get(key, key)
 
 
 #
@@ -1107,10 +1573,19 @@ class Scraper(object):
     # messages in case something is wrong (for example, the internet connection is broken or
     # the number of API calls is exceeded).
     EXCEPTION_COUNTER_THRESHOLD = 5
+    DISABLED_MSG = 'Maximum number of errors exceeded. Disabling scraper.'
     
     # Maximum amount of retries of certain requests
     RETRY_THRESHOLD = 4
 
+    # Requests a scraper can make at once before _wait_for_API_request() waits. 1 keeps the
+    # wait time between every request. Raise it only for APIs which accept short bursts.
+    API_REQUEST_BURST = 1
+    # (scraper name, wait time) -> net.TokenBucket. See _wait_for_API_request().
+    API_REQUEST_BUCKETS = {}
+    # Errors deferred in the current thread, see deferring_errors().
+    _deferred_errors = threading.local()
+
     # Disk cache types. These string will be part of the cache file names.
     CACHE_CANDIDATES = 'candidates'
     CACHE_METADATA = 'metadata'
@@ -1123,6 +1598,57 @@ class Scraper(object):
     
     JSON_indent = 1
     JSON_separators = (',', ':')
+    # Indent the disk cache files, for inspecting them when debugging. Without indentation
+    # the JSON encoder uses its much faster C implementation and the files are smaller.
+    JSON_PRETTY = False
+    # Compress the disk cache files with gzip. The repeated JSON keys compress very well, which
+    # makes loading faster on slow storage (SD cards, USB drives). Not used with JSON_PRETTY.
+    # Compressed caches are saved as *.json.gz, so older versions reading *.json never see
+    # them. Both compressed and plain cache files are loaded.
+    COMPRESS_DISK_CACHE = True
+    DISK_CACHE_COMPRESSLEVEL = 1
+    # Seconds after the last disk cache change to flush the caches in a background timer, so
+    # a burst of changes is written once. None (default) disables it. Only enable it in scrapers
+    # which change the caches with _update_disk_cache()/_delete_from_disk_cache() only and scrape
+    # one platform at a time: the timer thread flushes the caches of the current platform and
+    # does not hold the Kodi script invocation open, flush_disk_cache() must still be called.
+    FLUSH_DELAY_SEC = None
+    # Templates of the _new_*_dic() dictionaries. Copying a dictionary is faster than building
+    # it key by key. Values must be immutable, dictionaries are shallow copied.
+    CANDIDATE_TEMPLATE = {
+        'id': '',
+        'display_name': '',
+        'platform': '',
+        'scraper_platform': '',
+        'order': 0,
+    }
+    GAMEDATA_TEMPLATE = {
+        'title': '',
+        'year': '',
+        'genre': '',
+        'developer': '',
+        'nplayers': '',
+        'nplayers_online': '',
+        'esrb': '',
+        'pegi': '',
+        'plot': '',
+        'tags': None,
+        'extra': None
+    }
+    ASSETDATA_TEMPLATE = {
+        'asset_ID': None,
+        'display_name': '',
+        'url_thumb': '',
+        'url': '',
+        'downloadable': True
+    }
+
+    # Changes to a disk cache are appended to its journal file instead of rewriting the whole
+    # cache file, until the journal has more entries than this fraction of the cache entries.
+    JOURNAL_MAX_RATIO = 0.5
+
+    # Seconds a successful check_before_scraping() is reused. See check_before_scraping_cached().
+    CHECK_TTL_SEC = 21600
 
     # --- Constructor ----------------------------------------------------------------------------
     # @param cache_dir: [io.FileName] Path to scraper cache dir.
@@ -1149,20 +1675,45 @@ class Scraper(object):
         if not self.scraper_cache_dir.exists():
             self.scraper_cache_dir.makedirs()
 
-        self.logger.info(f'Scraper cache dir set to: {self.scraper_cache_dir.getPath()}')
-        self.last_http_call = datetime.now()
+        self.logger.info('Scraper cache dir set to: %s', self.scraper_cache_dir.getPath())
         
         # --- Disk caches ---
         self.disk_caches = {}
         self.disk_caches_loaded = {}
-        self.disk_caches_dirty = {}
+        self.disk_caches_dirty = _DirtyFlags()
+        # Entries changed since the last flush (_DELETED for deleted entries) and the number of
+        # entries in the journal file of each disk cache. The journal base is the generation of
+        # the cache file the journal on disk applies to, None when a new journal must be started.
+        self.disk_caches_changes = {}
+        self.disk_caches_journal_len = {}
+        self.disk_caches_journal_base = {}
+        # Disk caches changed with _update_disk_cache() and _delete_from_disk_cache(). Caches marked
+        # only in disk_caches_dirty are written too, fully as their changes are unknown.
+        self.dirty_cache_types = set()
+        # Disk caches already loaded by _load_disk_cache(), disk_caches_loaded is kept for compatibility.
+        self.loaded_cache_types = set()
+        # (cache type, platform) -> (full path, file name). Filled by _get_scraper_file_name().
+        self.disk_cache_file_names = {}
+        # Background flush scheduled by _schedule_flush(), time.monotonic() of the last change
+        # and the lock which keeps the flush from writing the caches while they are changed.
+        self.flush_timer = None
+        self.last_disk_cache_change = 0.0
+        self.disk_cache_lock = threading.RLock()
         for cache_name in Scraper.CACHE_LIST:
             self.disk_caches[cache_name] = {}
             self.disk_caches_loaded[cache_name] = False
             self.disk_caches_dirty[cache_name] = False
+            self.disk_caches_changes[cache_name] = {}
+            self.disk_caches_journal_len[cache_name] = 0
+            self.disk_caches_journal_base[cache_name] = None
         # Candidate game is set with functions set_candidate_from_cache() or set_candidate()
         # and used by functions get_metadata() and get_assets()
         self.candidate = None
+        # HTTP session to reuse connections between requests. Set by the ScrapeStrategy
+        # with set_http_session(). When None _get_http_session() creates one for this scraper.
+        self.http_session = None
+        # Persistent cache of the candidates found per search. Lazy created by get_search_results_cache().
+        self.search_results_cache = None
 
         # --- Global disk caches ---
         self.global_disk_caches = {}
@@ -1172,17 +1723,24 @@ class Scraper(object):
             self.global_disk_caches[cache_name] = {}
             self.global_disk_caches_loaded[cache_name] = False
             self.global_disk_caches_dirty[cache_name] = False
+        # cache type -> (full path, file name). Filled by _get_global_file_name().
+        self.global_disk_cache_file_names = {}
 
     # --- Methods --------------------------------------------------------------------------------
     # Scraper is much more verbose (even more than AKL Debug level).
     def set_verbose_mode(self, verbose_flag):
-        self.logger.debug('Scraper.set_verbose_mode() verbose_flag {0}'.format(verbose_flag))
+        self.logger.debug('Scraper.set_verbose_mode() verbose_flag %s', verbose_flag)
         self.verbose_flag = verbose_flag
 
+    # Share a keep-alive HTTP session. Scraper implementations should pass it to the
+    # net.get_URL()/net.post_URL() calls with the session argument.
+    def set_http_session(self, session):
+        self.http_session = session
+
     # Dump scraper data into files for debugging. Used in the development scripts.
     def set_debug_file_dump(self, dump_file_flag, dump_dir):
-        self.logger.debug('Scraper.set_debug_file_dump() dump_file_flag {0}'.format(dump_file_flag))
-        self.logger.debug('Scraper.set_debug_file_dump() dump_dir {0}'.format(dump_dir))
+        self.logger.debug('Scraper.set_debug_file_dump() dump_file_flag %s', dump_file_flag)
+        self.logger.debug('Scraper.set_debug_file_dump() dump_dir %s', dump_dir)
         self.dump_file_flag = dump_file_flag
         self.dump_dir = dump_dir
 
@@ -1190,7 +1748,7 @@ class Scraper(object):
     # externally for debugging purposes, for example when debugging the scraper with
     # fake filenames.
     def set_debug_checksums(self, debug_checksums, crc_str='', md5_str='', sha1_str='', size=0):
-        self.logger.debug('Scraper.set_debug_checksums() debug_checksums {0}'.format(debug_checksums))
+        self.logger.debug('Scraper.set_debug_checksums() debug_checksums %s', debug_checksums)
         self.debug_checksums_flag = debug_checksums
         self.debug_crc = crc_str
         self.debug_md5 = md5_str
@@ -1255,6 +1813,36 @@ class Scraper(object):
     def check_before_scraping(self, status_dic):
         pass
 
+    # Returns a string which identifies the configuration checked by check_before_scraping(),
+    # for example a hash of the API key. Scrapers whose check needs a web request can return
+    # it so a successful check is reused for CHECK_TTL_SEC seconds, also in later scans.
+    # Default is None, the check runs every time.
+    def get_check_key(self):
+        return None
+
+    # Calls check_before_scraping() unless it passed with the same get_check_key() less than
+    # CHECK_TTL_SEC seconds ago.
+    def check_before_scraping_cached(self, status_dic):
+        check_key = self.get_check_key()
+        if check_key is None:
+            self.check_before_scraping(status_dic)
+            return
+
+        checks_FN = self.scraper_cache_dir.pjoin(self.get_filename() + '__checks.json')
+        checked_at = None
+        if checks_FN.exists():
+            try:
+                checked_at = checks_FN.readJson().get(check_key)
+            except Exception:
+                self.logger.warning('Scraper.check_before_scraping_cached() Cannot read %s', checks_FN.getPath())
+        if checked_at is not None and time.time() - checked_at < self.CHECK_TTL_SEC:
+            self.logger.debug('Scraper.check_before_scraping_cached() %s checked recently. Skipping.', self.get_name())
+            return
+
+        self.check_before_scraping(status_dic)
+        if status_dic['status']:
+            checks_FN.saveStrToFileAtomic(json.dumps({check_key: time.time()}))
+
     # The *_candidates_cache_*() functions use the low level cache functions which are internal
     # to the Scraper object. The functions next are public, however.
 
@@ -1273,6 +1861,16 @@ class Scraper(object):
 
         return self._retrieve_from_disk_cache(Scraper.CACHE_CANDIDATES, self.cache_key)
 
+    # Returns the candidates cache entries of the given ROMs, loading the cache only once.
+    # ROMs not in the cache are not included in the returned dictionary.
+    def get_cached_candidates(self, rom_identifiers: typing.List[str], platform) -> dict:
+        self.platform = platform
+        self._lazy_load_disk_cache(Scraper.CACHE_CANDIDATES)
+        candidates_cache = self.disk_caches[Scraper.CACHE_CANDIDATES]
+
+        return {rom_identifier: candidates_cache[rom_identifier]
+                for rom_identifier in rom_identifiers if rom_identifier in candidates_cache}
+
     def set_candidate_from_cache(self, rom_identifier: str, platform):
         self.cache_key = rom_identifier
         self.platform = platform
@@ -1282,77 +1880,108 @@ class Scraper(object):
         self.cache_key = rom_identifier
         self.platform = platform
         self.candidate = candidate
-        self.logger.debug('Scrape.set_candidate() Setting "{}" "{}"'.format(self.cache_key, platform))
+        self.logger.debug('Scrape.set_candidate() Setting "%s" "%s"', self.cache_key, platform)
         # Do not introduce None candidates in the cache so the game will be rescraped later.
         # Keep the None candidate in the object internal variables so later calls to 
         # get_metadata() and get_assets() will know an error happened.
         if candidate is None:
             return
         self._update_disk_cache(Scraper.CACHE_CANDIDATES, self.cache_key, candidate)
-        self.logger.debug('Scrape.set_candidate() Added "{}" to cache'.format(self.cache_key))
+        self.logger.debug('Scrape.set_candidate() Added "%s" to cache', self.cache_key)
 
     # When the user decides to rescrape an item that was in the cache make sure all
     # the caches are purged.
     def clear_cache(self, rom_identifier: str, platform):
         self.cache_key = rom_identifier
         self.platform = platform
-        self.logger.debug('Scraper.clear_cache() Clearing caches "{}" "{}"'.format(
-            self.cache_key, platform))
+        self.logger.debug('Scraper.clear_cache() Clearing caches "%s" "%s"', self.cache_key, platform)
         for cache_type in Scraper.CACHE_LIST:
             if self._check_disk_cache(cache_type, self.cache_key):
                 self._delete_from_disk_cache(cache_type, self.cache_key)
+        results_cache = self.get_search_results_cache()
+        if results_cache is not None:
+            results_cache.delete_rom_candidates(Scraper.get_search_results_rom_key(rom_identifier, platform))
+
+    # Writes the disk caches now. A pending background flush is cancelled.
+    def flush_disk_cache(self, pdialog: kodi.ProgressDialog = None):
+        self._cancel_flush_timer()
+        with self.disk_cache_lock:
+            self._flush_disk_cache(pdialog)
 
     # Only write to disk non-empty caches.
     # Only write to disk dirty caches. If cache has not been modified then do not write it.
-    def flush_disk_cache(self, pdialog: kodi.ProgressDialog = None):
+    def _flush_disk_cache(self, pdialog: kodi.ProgressDialog = None):
         # If scraper does not use disk cache (notably AKL Offline) return.
         if not self.supports_disk_cache():
-            self.logger.debug('Scraper.flush_disk_cache() Scraper {} does not use disk cache.'.format(
-                self.get_name()))
+            self.logger.debug('Scraper.flush_disk_cache() Scraper %s does not use disk cache.', self.get_name())
             return
 
+        if self.search_results_cache is not None:
+            self.search_results_cache.commit()
+
+        # Only the dirty caches are visited. A cache is loaded before it can become dirty.
+        # Scrapers may still change disk_caches directly and only set disk_caches_dirty.
+        dirty_cache_types = [
+            cache_type for cache_type in Scraper.CACHE_LIST
+            if cache_type in self.dirty_cache_types or self.disk_caches_dirty[cache_type]]
+
         # Create progress dialog.
-        num_steps = len(Scraper.CACHE_LIST)  # + len(Scraper.GLOBAL_CACHE_LIST)
+        num_steps = len(dirty_cache_types)  # + len(Scraper.GLOBAL_CACHE_LIST)
         step_count = 0
         if pdialog is not None:
             pdialog.startProgress('Flushing scraper disk caches...', num_steps)
 
         # --- Scraper caches ---
-        self.logger.debug('Scraper.flush_disk_cache() Saving scraper {} disk cache...'.format(
-            self.get_name()))
-        for cache_type in Scraper.CACHE_LIST:
+        self.logger.debug('Scraper.flush_disk_cache() Saving scraper %s disk cache...', self.get_name())
+        pending_writes = []
+        for cache_type in dirty_cache_types:
             if pdialog is not None:
                 pdialog.updateProgress(step_count)
                 step_count += 1
 
-            # Skip unloaded caches
-            if not self.disk_caches_loaded[cache_type]:
-                self.logger.debug('Skipping {} (Unloaded)'.format(cache_type))
-                continue
             # Skip empty caches
             if not self.disk_caches[cache_type]:
-                self.logger.debug('Skipping {} (Empty)'.format(cache_type))
-                continue
-            # Skip clean caches.
-            if not self.disk_caches_dirty[cache_type]:
-                self.logger.debug('Skipping {} (Clean)'.format(cache_type))
+                self.logger.debug('Skipping %s (Empty)', cache_type)
                 continue
 
-            # Get JSON data.
-            json_data = json.dumps(
-                self.disk_caches[cache_type], ensure_ascii=False, sort_keys=True,
-                indent=Scraper.JSON_indent, separators=Scraper.JSON_separators)
-
-            # Write to disk
             json_file_path, json_fname = self._get_scraper_file_name(cache_type, self.platform)
-            file = io.FileName(json_file_path)
-            file.writeAll(json_data)
-            
-            # self.logger.debug('Saved "{}"'.format(json_file_path))
-            self.logger.debug('Saved "<SCRAPER_CACHE_DIR>/{}"'.format(json_fname))
-
-            # Cache written to disk is clean gain.
-            self.disk_caches_dirty[cache_type] = False
+            changes = self.disk_caches_changes[cache_type]
+            journal_len = self.disk_caches_journal_len[cache_type] + len(changes)
+            if self._can_append_to_journal(cache_type, json_file_path, journal_len):
+                # Only the changed entries are written.
+                journal_data = ''.join(
+                    _encode_journal_entry([key] if value is _DELETED else [key, value]) + '\n'
+                    for key, value in changes.items())
+                write = functools.partial(self._append_to_journal, json_file_path, journal_data,
+                                          self.disk_caches_journal_base[cache_type])
+            else:
+                if self.JSON_PRETTY:
+                    json_data = json.dumps(
+                        self.disk_caches[cache_type], ensure_ascii=False, sort_keys=True,
+                        indent=Scraper.JSON_indent, separators=Scraper.JSON_separators)
+                else:
+                    json_data = _encode_disk_cache(self.disk_caches[cache_type])
+                write = functools.partial(self._save_disk_cache_file, json_file_path, json_data)
+                journal_len = 0
+            pending_writes.append((cache_type, json_fname, journal_len, write))
+
+        # Write to disk. The files are independent so they are written at the same time,
+        # the flush then takes as long as the slowest write instead of the sum of all.
+        if pending_writes:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(pending_writes)) as executor:
+                futures = [(cache_type, json_fname, journal_len, executor.submit(write))
+                           for cache_type, json_fname, journal_len, write in pending_writes]
+            for cache_type, json_fname, journal_len, future in futures:
+                # Raises the exception of a failed write.
+                journal_base = future.result()
+                self.logger.debug('Saved "<SCRAPER_CACHE_DIR>/%s" (%s journal entries)', json_fname, journal_len)
+
+                # Cache written to disk is clean gain.
+                self.disk_caches_dirty[cache_type] = False
+                self.dirty_cache_types.discard(cache_type)
+                self.disk_caches_changes[cache_type] = {}
+                self.disk_caches_journal_len[cache_type] = journal_len
+                self.disk_caches_journal_base[cache_type] = journal_base
 
         # --- Global caches ---
         # self.logger.debug('Scraper.flush_disk_cache() Saving scraper {} global disk cache...'.format(
@@ -1416,6 +2045,55 @@ class Scraper(object):
     def get_candidates(self, search_term, rom: ROMObj, platform, status_dic):
         pass
 
+    # Returns the key which identifies a candidate search, to reuse the search results for
+    # other ROMs with the same key when scraping multiple ROMs. Return None if the search
+    # results depend on the ROM itself (checksums, filename, etc.), which is the default.
+    #
+    # @param search_term: [str] String to be searched.
+    # @param rom: [ROMObj] ROM to search candidates for.
+    # @param platform: [str] AKL platform.
+    # @return: [hashable] or None.
+    def get_candidates_batch_key(self, search_term, rom: ROMObj, platform):
+        return None
+
+    # Returns True if the scraper implements get_candidates_batch() with a real batch query.
+    def supports_candidates_batch(self):
+        return False
+
+    # Returns True if get_candidates() can run in a background thread while this scraper is
+    # used to get the metadata and assets of other ROMs. Candidates of the next ROMs are then
+    # searched ahead during scraping. get_candidates() must not use the candidate set in the
+    # scraper object nor write the disk caches. Requires get_candidates_batch_key().
+    def supports_concurrent_search(self):
+        return False
+
+    # Search candidates for multiple ROMs at once.
+    # Default implementation calls get_candidates() for each item. Override in scrapers whose
+    # API supports searching multiple games with a single request.
+    #
+    # @param search_items: [list] List of (search_term, rom, platform) tuples.
+    # @param status_dic: [dict] kodi_new_status_dic() status dictionary.
+    # @return: [list] List with the get_candidates() result of each item, in the same order.
+    def get_candidates_batch(self, search_items: list, status_dic):
+        return [self.get_candidates(search_term, rom, platform, status_dic)
+                for search_term, rom, platform in search_items]
+
+    # Returns True if the scraper implements get_candidates_bulk().
+    def supports_bulk(self):
+        return False
+
+    # Gets the metadata and assets of multiple candidates at once, for example with a single
+    # request to an API endpoint which accepts multiple game IDs. Results must be stored in
+    # the CACHE_METADATA and CACHE_ASSETS disk caches with the ROM identifier as key, so
+    # later calls to get_metadata() and get_assets() are served from the caches.
+    # Called before scraping multiple ROMs with the candidates found in the candidates cache.
+    #
+    # @param candidates: [dict] ROM identifier -> _new_candidate_dic() candidate.
+    # @param platform: [str] AKL platform.
+    # @param status_dic: [dict] kodi_new_status_dic() status dictionary.
+    def get_candidates_bulk(self, candidates: dict, platform, status_dic):
+        pass
+
     # Returns the metadata for a candidate (search result).
     #
     # * See comments in get_candidates()
@@ -1470,12 +2148,35 @@ class Scraper(object):
     def resolve_asset_URL_extension(self, selected_asset, image_url, status_dic):
         pass
 
+    # Resolves the asset URL and the URL image extension. Used by the ScrapeStrategy.
+    # Default implementation calls resolve_asset_URL() and resolve_asset_URL_extension().
+    # Override in scrapers which can get both with a single request, for example using the
+    # Content-Type header of the response which resolves the URL.
+    #
+    # @param selected_asset:
+    # @param status_dic: [dict] kodi_new_status_dic() status dictionary.
+    # @return: [tuple] URL to download the asset, URL for printing in logs and image extension.
+    #          The extension is None if the URL could not be resolved.
+    def resolve_asset_URL_and_extension(self, selected_asset, status_dic):
+        image_url, image_url_log = self.resolve_asset_URL(selected_asset, status_dic) or (None, None)
+        if not status_dic['status'] or not image_url:
+            return image_url, image_url_log, None
+
+        image_ext = self.resolve_asset_URL_extension(selected_asset, image_url, status_dic)
+        return image_url, image_url_log, image_ext
+
     # Downloads an image from the given url to the local path.
     # Can overwrite this method in scraper implementation to support extra actions, like
     # request throttling.
+    # Returns True if download_image() can be called from multiple threads at the same time, so
+    # images are downloaded in the background while scraping. True for the default implementation.
+    # Scrapers overriding download_image() must override this method too to enable it.
+    def supports_concurrent_downloads(self):
+        return type(self).download_image is Scraper.download_image
+
     def download_image(self, image_url, image_local_path):
         # net_download_img() never prints URLs or paths.
-        net.download_img(image_url, image_local_path)
+        net.download_img(image_url, image_local_path, session=self._get_http_session())
         return image_local_path
 
     # Not used now. candidate['id'] is used as hash value for the whole candidate dictionary.
@@ -1493,48 +2194,55 @@ class Scraper(object):
     # or representation of the dictionary.
     # See https://stackoverflow.com/questions/5884066/hashing-a-dictionary
     def _new_candidate_dic(self):
-        return {
-            'id': '',
-            'display_name': '',
-            'platform': '',
-            'scraper_platform': '',
-            'order': 0,
-        }
+        return Scraper.CANDIDATE_TEMPLATE.copy()
 
+    # tags and extra are mutable, every dictionary gets its own.
     def _new_gamedata_dic(self):
-        return {
-            'title': '',
-            'year': '',
-            'genre': '',
-            'developer': '',
-            'nplayers': '',
-            'nplayers_online': '',
-            'esrb': '',
-            'pegi': '',
-            'plot': '',
-            'tags': [],
-            'extra': {}
-        }
+        gamedata = Scraper.GAMEDATA_TEMPLATE.copy()
+        gamedata['tags'] = []
+        gamedata['extra'] = {}
+        return gamedata
 
     # url_thumb is always returned by get_assets().
     # url is returned by resolve_asset_URL().
     # Note that some scrapers (MobyGames) return both url_thumb and url in get_assets(). Always
     # call resolve_asset_URL() for compabilitity with all scrapers.
     def _new_assetdata_dic(self):
-        return {
-            'asset_ID': None,
-            'display_name': '',
-            'url_thumb': '',
-            'url': '',
-            'downloadable': True
-        }
+        return Scraper.ASSETDATA_TEMPLATE.copy()
+
+    # Errors of the current thread are only put in status_dic and collected in the returned
+    # list, not logged nor counted. Used for the searches done ahead in a background thread.
+    @staticmethod
+    @contextlib.contextmanager
+    def deferring_errors():
+        deferred_msgs = []
+        Scraper._deferred_errors.msgs = deferred_msgs
+        try:
+            yield deferred_msgs
+        finally:
+            Scraper._deferred_errors.msgs = None
 
     # This functions is called when an error that is not an exception and needs to increase
     # the scraper error limit happens.
     # All messages generated in the scrapers are KODI_MESSAGE_DIALOG.
     def _handle_error(self, status_dic, user_msg):
+        deferred_msgs = getattr(Scraper._deferred_errors, 'msgs', None)
+        if deferred_msgs is not None:
+            status_dic['status'] = False
+            status_dic['dialog'] = kodi.KODI_MESSAGE_DIALOG
+            status_dic['msg'] = user_msg
+            deferred_msgs.append(user_msg)
+            return
+
+        # A disabled scraper already logged why it was disabled. Only report the error.
+        if self.scraper_disabled:
+            status_dic['status'] = False
+            status_dic['dialog'] = kodi.KODI_MESSAGE_DIALOG
+            status_dic['msg'] = Scraper.DISABLED_MSG
+            return
+
         # Print error message to the log.
-        self.logger.error('Scraper._handle_error() user_msg "{}"'.format(user_msg))
+        self.logger.error('Scraper._handle_error() user_msg "%s"', user_msg)
 
         # Fill in the status dictionary so the error message will be propagated up in the
         # stack and the error message printed in the GUI.
@@ -1546,55 +2254,193 @@ class Scraper(object):
         # if the number of errors is higher than a threshold.
         self.exception_counter += 1
         if self.exception_counter > Scraper.EXCEPTION_COUNTER_THRESHOLD:
-            err_m = 'Maximum number of errors exceeded. Disabling scraper.'
-            self.logger.error(err_m)
+            self.logger.error(Scraper.DISABLED_MSG)
             self.scraper_disabled = True
             # Replace error message witht the one that the scraper is disabled.
-            status_dic['msg'] = err_m
+            status_dic['msg'] = Scraper.DISABLED_MSG
 
     # This function is called when an exception in the scraper code happens.
     # All messages from the scrapers are KODI_MESSAGE_DIALOG.
     def _handle_exception(self, ex, status_dic, user_msg):
-        self.logger.exception(f'(Exception) Message "{user_msg}"')
+        self.logger.exception('(Exception) Message "%s"', user_msg)
         self._handle_error(status_dic, user_msg)
 
     # --- Private disk cache functions -----------------------------------------------------------
+    # File names are built once per cache type and platform.
     def _get_scraper_file_name(self, cache_type, platform):
-        scraper_filename = self.get_filename()
-        json_fname = scraper_filename + '__' + platform + '__' + cache_type + '.json'
-        json_full_path = self.scraper_cache_dir.pjoin(json_fname).getPath()
+        file_names = self.disk_cache_file_names.get((cache_type, platform))
+        if file_names is None:
+            json_fname = f'{self.get_filename()}__{platform}__{cache_type}.json'
+            json_full_path = self.scraper_cache_dir.pjoin(json_fname).getPath()
+            file_names = self.disk_cache_file_names[(cache_type, platform)] = (json_full_path, json_fname)
+
+        return file_names
+
+    def _get_scraper_journal_file_name(self, json_file_path: str):
+        return json_file_path + 'l'
+
+    def _get_scraper_compressed_file_name(self, json_file_path: str):
+        return json_file_path + '.gz'
+
+    # Returns the path of the cache file written by _save_disk_cache_file() and the path of
+    # the cache file in the other format, which is removed when saving.
+    def _get_scraper_save_file_names(self, json_file_path: str):
+        compressed_file_path = self._get_scraper_compressed_file_name(json_file_path)
+        if not self.COMPRESS_DISK_CACHE or self.JSON_PRETTY:
+            return json_file_path, compressed_file_path
+        return compressed_file_path, json_file_path
+
+    # The journal is only used for local caches which already have a cache file and only
+    # while it stays small compared to the cache. Caches changed outside _update_disk_cache()
+    # and _delete_from_disk_cache() and caches with files in both formats are written fully.
+    def _can_append_to_journal(self, cache_type: str, json_file_path: str, journal_len: int) -> bool:
+        if not self.disk_caches_changes[cache_type] or not self.scraper_cache_dir.is_local:
+            return False
+        if cache_type in self.disk_caches_dirty.untracked:
+            return False
+        if journal_len > len(self.disk_caches[cache_type]) * self.JOURNAL_MAX_RATIO:
+            return False
+        save_file_path, other_file_path = self._get_scraper_save_file_names(json_file_path)
+        return os.path.isfile(save_file_path) and not os.path.isfile(other_file_path)
+
+    # A new journal starts with a header with the generation of the cache file it applies to.
+    # Returns the generation.
+    def _append_to_journal(self, json_file_path: str, journal_data: str, journal_base):
+        journal_file_path = self._get_scraper_journal_file_name(json_file_path)
+        if journal_base is None:
+            save_file_path, _ = self._get_scraper_save_file_names(json_file_path)
+            journal_base = _get_file_generation(save_file_path)
+            journal_data = _encode_journal_entry({'base': journal_base}) + '\n' + journal_data
+            mode = 'wb'
+        else:
+            mode = 'ab'
+        with open(journal_file_path, mode) as file:
+            file.write(journal_data.encode('utf-8'))
+        return journal_base
+
+    # Writes the whole cache. The new file is written atomically before the outdated files are
+    # removed, an interrupted save keeps the previous cache. A journal left behind does not
+    # apply to the new file generation and is ignored when loading. Returns None, the journal
+    # base, as there is no journal after a save.
+    def _save_disk_cache_file(self, json_file_path: str, json_data: str):
+        save_file_path, other_file_path = self._get_scraper_save_file_names(json_file_path)
+        if save_file_path == json_file_path:
+            io.FileName(json_file_path).saveStrToFileAtomic(json_data)
+        else:
+            data = json_data.encode('utf-8')
+            compressed_data = gzip.compress(data, compresslevel=self.DISK_CACHE_COMPRESSLEVEL)
+            io.FileName(save_file_path).saveBytesToFileAtomic(compressed_data)
+            self.logger.debug('Scraper._save_disk_cache_file() Compressed %d bytes to %d bytes',
+                              len(data), len(compressed_data))
+
+        try:
+            os.remove(self._get_scraper_journal_file_name(json_file_path))
+        except FileNotFoundError:
+            pass
+        other_FN = io.FileName(other_file_path)
+        if other_FN.exists():
+            other_FN.unlink()
+        return None
+
+    # Applies the journal entries on the loaded cache. Returns the number of entries and the
+    # journal base. A journal of another generation of the cache file is ignored. A line cut
+    # off by an interrupted append ends the journal.
+    def _load_journal(self, cache_type: str, json_file_path: str, base_file_path: str):
+        journal_file_path = self._get_scraper_journal_file_name(json_file_path)
+        try:
+            file = open(journal_file_path, 'rb')
+        except FileNotFoundError:
+            return 0, None
 
-        return json_full_path, json_fname
+        disk_cache = self.disk_caches[cache_type]
+        journal_len = 0
+        with file:
+            try:
+                header = json.loads(file.readline())
+            except ValueError:
+                header = None
+            journal_base = _get_file_generation(base_file_path) if base_file_path else None
+            if not isinstance(header, dict) or journal_base is None or header.get('base') != journal_base:
+                self.logger.debug('Scraper._load_journal() Ignoring outdated journal %s', journal_file_path)
+                return 0, None
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    self.logger.warning('Scraper._load_journal() Incomplete entry in %s', journal_file_path)
+                    break
+                if len(entry) == 2:
+                    disk_cache[entry[0]] = entry[1]
+                else:
+                    disk_cache.pop(entry[0], None)
+                journal_len += 1
+        return journal_len, journal_base
 
     def _lazy_load_disk_cache(self, cache_type):
-        if not self.disk_caches_loaded[cache_type]:
+        if cache_type not in self.loaded_cache_types:
             self._load_disk_cache(cache_type, self.platform)
 
+    # Returns the most recently modified of the existing files, None if none exists.
+    def _get_newest_file(self, *file_paths):
+        newest_file_path = None
+        newest_mtime = None
+        for file_path in file_paths:
+            try:
+                mtime = os.stat(file_path).st_mtime_ns
+            except FileNotFoundError:
+                continue
+            if newest_mtime is None or mtime > newest_mtime:
+                newest_file_path, newest_mtime = file_path, mtime
+        return newest_file_path
+
+    # Returns the file contents as bytes, None if the file does not exist.
+    # json.loads() decodes the UTF-8 bytes itself, faster than a text mode read.
+    def _read_disk_cache_file(self, file_path: str):
+        try:
+            with open(file_path, 'rb') as file:
+                return file.read()
+        except FileNotFoundError:
+            return None
+
     def _load_disk_cache(self, cache_type, platform):
         # --- Get filename ---
         json_file_path, json_fname = self._get_scraper_file_name(cache_type, platform)
-        self.logger.debug('Scraper._load_disk_cache() Loading cache "{}"'.format(cache_type))
+        self.logger.debug('Scraper._load_disk_cache() Loading cache "%s"', cache_type)
 
         # --- Load cache if file exists ---
-        if os.path.isfile(json_file_path):
-            file = open(json_file_path)
-            file_contents = file.read()
-            file.close()
-            self.disk_caches[cache_type] = json.loads(file_contents)
-            # self.logger.debug('Loaded "{}"'.format(json_file_path))
-            self.logger.debug('Loaded "<SCRAPER_CACHE_DIR>/{}"'.format(json_fname))
-        else:
+        # When both formats exist the newer file is loaded. Either a save was interrupted before
+        # removing the old file or an older version rewrote the plain file.
+        compressed_file_path = self._get_scraper_compressed_file_name(json_file_path)
+        base_file_path = self._get_newest_file(json_file_path, compressed_file_path)
+        file_contents = None
+        if base_file_path is not None:
+            file_contents = self._read_disk_cache_file(base_file_path)
+        if file_contents is not None and base_file_path == compressed_file_path:
+            file_contents = gzip.decompress(file_contents)
+            json_fname += '.gz'
+        if file_contents is None:
             self.logger.debug('Cache file not found. Resetting cache.')
             self.disk_caches[cache_type] = {}
+            base_file_path = None
+        else:
+            self.disk_caches[cache_type] = json.loads(file_contents)
+            # self.logger.debug('Loaded "{}"'.format(json_file_path))
+            self.logger.debug('Loaded "<SCRAPER_CACHE_DIR>/%s"', json_fname)
+        journal_len, journal_base = self._load_journal(cache_type, json_file_path, base_file_path)
+        self.disk_caches_journal_len[cache_type] = journal_len
+        self.disk_caches_journal_base[cache_type] = journal_base
         self.disk_caches_loaded[cache_type] = True
+        self.loaded_cache_types.add(cache_type)
         self.disk_caches_dirty[cache_type] = False
+        self.dirty_cache_types.discard(cache_type)
+        self.disk_caches_changes[cache_type] = {}
 
     # Returns True if item is in the cache, False otherwise.
     # Lazy loads cache files from disk.
     def _check_disk_cache(self, cache_type: str, cache_key: str):
         self._lazy_load_disk_cache(cache_type)
 
-        return True if cache_key in self.disk_caches[cache_type] else False
+        return cache_key in self.disk_caches[cache_type]
 
     # _check_disk_cache() must be called before this.
     def _retrieve_from_disk_cache(self, cache_type: str, cache_key: str):
@@ -1602,22 +2448,114 @@ class Scraper(object):
 
     # _check_disk_cache() must be called before this.
     def _delete_from_disk_cache(self, cache_type: str, cache_key: str):
-        del self.disk_caches[cache_type][cache_key]
-        self.disk_caches_dirty[cache_type] = True
+        with self.disk_cache_lock:
+            del self.disk_caches[cache_type][cache_key]
+            self.disk_caches_dirty.set_tracked(cache_type)
+            self.dirty_cache_types.add(cache_type)
+            self.disk_caches_changes[cache_type][cache_key] = _DELETED
+        self._schedule_flush()
 
     # Lazy loading should be done here because the internal cache for ScreenScraper
     # could be updated withouth being loaded first with _check_disk_cache().
+    # Storing equal data again does not mark the cache dirty, so rescraping cached items
+    # does not rewrite the whole cache file. The same object may have been modified in place,
+    # so it always marks the cache dirty.
     def _update_disk_cache(self, cache_type: str, cache_key: str, data):
         self._lazy_load_disk_cache(cache_type)
-        self.disk_caches[cache_type][cache_key] = data
-        self.disk_caches_dirty[cache_type] = True
+        disk_cache = self.disk_caches[cache_type]
+        cached_data = disk_cache.get(cache_key, None)
+        if cached_data is not None and cached_data is not data and cached_data == data:
+            return
+        with self.disk_cache_lock:
+            disk_cache[cache_key] = data
+            self.disk_caches_dirty.set_tracked(cache_type)
+            self.dirty_cache_types.add(cache_type)
+            self.disk_caches_changes[cache_type][cache_key] = data
+        self._schedule_flush()
+
+    # Records the change time and starts the background flush timer if none is pending.
+    # The timer is not restarted on every change, it waits again itself if there were changes.
+    def _schedule_flush(self):
+        if self.FLUSH_DELAY_SEC is None or not self.supports_disk_cache():
+            return
+        with self.disk_cache_lock:
+            self.last_disk_cache_change = time.monotonic()
+            if self.flush_timer is None:
+                self._start_flush_timer(self.FLUSH_DELAY_SEC)
+
+    def _start_flush_timer(self, delay: float):
+        self.flush_timer = threading.Timer(delay, self._flush_disk_cache_in_background)
+        self.flush_timer.daemon = True
+        self.flush_timer.start()
+
+    def _cancel_flush_timer(self):
+        with self.disk_cache_lock:
+            if self.flush_timer is not None:
+                self.flush_timer.cancel()
+                self.flush_timer = None
+
+    def _flush_disk_cache_in_background(self):
+        with self.disk_cache_lock:
+            # Cancelled by flush_disk_cache() while starting.
+            if self.flush_timer is not threading.current_thread():
+                return
+            remaining = self.last_disk_cache_change + self.FLUSH_DELAY_SEC - time.monotonic()
+            if remaining > 0:
+                self._start_flush_timer(remaining)
+                return
+            self.flush_timer = None
+        try:
+            self.flush_disk_cache()
+        except Exception:
+            self.logger.exception('(Exception) Flushing scraper %s disk cache.', self.get_name())
+
+    # --- Private HTTP session -------------------------------------------------------------------
+    # Scrapers used outside a ScrapeStrategy have no shared session. A keep-alive session is
+    # created on first use so their requests still reuse connections.
+    def _get_http_session(self):
+        if self.http_session is None:
+            self.http_session = net.start_http_session()
+        return self.http_session
+
+    # --- Persistent search results cache --------------------------------------------------------
+    # Used by the CandidateLoader for scrapers that provide a key with get_candidates_batch_key().
+    # Returns None if the scraper does not support the disk cache.
+    def get_search_results_cache(self) -> typing.Optional[scrape_cache.ScrapeResultCache]:
+        if not self.supports_disk_cache() or not self.scraper_cache_dir.is_local:
+            return None
+        if self.search_results_cache is None:
+            db_fname = self.get_filename() + '__search_results.sqlite'
+            db_path = self.scraper_cache_dir.pjoin(db_fname).getPathTranslated()
+            self.search_results_cache = scrape_cache.ScrapeResultCache(db_path)
+        return self.search_results_cache
+
+    # Key of the search results used by a ROM, see ScrapeResultCache.delete_rom_candidates().
+    @staticmethod
+    def get_search_results_rom_key(rom_identifier: str, platform) -> str:
+        return repr((rom_identifier, platform))
+
+    # Writes the pending search results and closes the database. Reopened when used again.
+    def close_search_results_cache(self):
+        if self.search_results_cache is not None:
+            self.search_results_cache.close()
+
+    # Removes all the stored search results of this scraper.
+    def clear_search_results_cache(self):
+        self.logger.debug('Scraper.clear_search_results_cache() Clearing search results of %s', self.get_name())
+        results_cache = self.get_search_results_cache()
+        if results_cache is not None:
+            results_cache.clear()
 
     # --- Private global disk caches -------------------------------------------------------------
+    # File names are built once per cache type.
     def _get_global_file_name(self, cache_type: str):
-        json_fname = cache_type + '.json'
-        json_full_path = self.scraper_cache_dir.pjoin(json_fname).getPath()
+        file_names = self.global_disk_cache_file_names.get(cache_type)
+        if file_names is None:
+            json_fname = cache_type + '.json'
+            json_full_path = self.scraper_cache_dir.pjoin(json_fname).getPath()
+            file_names = self.global_disk_cache_file_names[cache_type] = (json_full_path, json_fname)
 
-        return json_full_path, json_fname
+        return file_names
 
     def _lazy_load_global_disk_cache(self, cache_type):
         if not self.global_disk_caches_loaded[cache_type]:
@@ -1626,19 +2564,19 @@ class Scraper(object):
     def _load_global_cache(self, cache_type):
         # --- Get filename ---
         json_file_path, json_fname = self._get_global_file_name(cache_type)
-        self.logger.debug('Scraper._load_global_cache() Loading cache "{}"'.format(cache_type))
+        self.logger.debug('Scraper._load_global_cache() Loading cache "%s"', cache_type)
 
         # --- Load cache if file exists ---
-        if os.path.isfile(json_file_path):
-            file = open(json_file_path)
-            file_contents = file.read()
-            file.close()
-            self.global_disk_caches[cache_type] = json.loads(file_contents)
-            # self.logger.debug('Loaded "{}"'.format(json_file_path))
-            self.logger.debug('Loaded "<SCRAPER_CACHE_DIR>/{}"'.format(json_fname))
-        else:
+        try:
+            with open(json_file_path, 'rb') as file:
+                file_contents = file.read()
+        except FileNotFoundError:
             self.logger.debug('Cache file not found. Resetting cache.')
             self.global_disk_caches[cache_type] = {}
+        else:
+            self.global_disk_caches[cache_type] = json.loads(file_contents)
+            # self.logger.debug('Loaded "{}"'.format(json_file_path))
+            self.logger.debug('Loaded "<SCRAPER_CACHE_DIR>/%s"', json_fname)
         self.global_disk_caches_loaded[cache_type] = True
         self.global_disk_caches_dirty[cache_type] = False
 
@@ -1663,15 +2601,21 @@ class Scraper(object):
 
     # Generic waiting method to avoid too many requests
     # and website abuse. 
+    # The requests are limited with a token bucket per scraper and wait time, shared by all the
+    # objects of the scraper. API_REQUEST_BURST requests can be made without waiting.
     def _wait_for_API_request(self, wait_time_in_miliseconds=1000):
         if wait_time_in_miliseconds == 0:
             return
         
         # Make sure we dont go over the TooManyRequests limit of 1 second.
-        now = datetime.now()
-        if (now - self.last_http_call).total_seconds() * 1000 < wait_time_in_miliseconds:
-            self.logger.debug('Scraper._wait_for_API_request() Sleeping {}ms to avoid overloading...'.format(wait_time_in_miliseconds))
-            time.sleep(wait_time_in_miliseconds / 1000)
+        bucket_key = (self.get_name(), wait_time_in_miliseconds)
+        bucket = Scraper.API_REQUEST_BUCKETS.get(bucket_key)
+        if bucket is None:
+            bucket = Scraper.API_REQUEST_BUCKETS.setdefault(
+                bucket_key, net.TokenBucket(1000 / wait_time_in_miliseconds, self.API_REQUEST_BURST))
+        wait_time = bucket.consume()
+        if wait_time > 0:
+            self.logger.debug('Scraper._wait_for_API_request() Waited %dms to avoid overloading...', wait_time * 1000)
 
 
 # ------------------------------------------------------------------------------------------------
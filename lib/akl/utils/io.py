@@ -534,6 +534,43 @@ class FileName(FileType):
             logger.error('(IOError) Cannot write {0} file'.format(self.path_tr))
             raise constants.AddonError('(IOError) Cannot write {0} file'.format(self.path_tr))
 
+    #
+    # Same as saveStrToFile() but local files are first written to a temporary file which then
+    # replaces the destination. An interrupted write never leaves a truncated file behind.
+    # Remote files are written directly.
+    #
+    def saveStrToFileAtomic(self, data_str: str, encoding = 'utf-8'):
+        if not self.is_local:
+            return self.saveStrToFile(data_str, encoding)
+
+        self.saveBytesToFileAtomic(data_str.encode(encoding))
+
+    #
+    # Same as saveStrToFileAtomic() for binary data.
+    #
+    def saveBytesToFileAtomic(self, data: bytes):
+        if not self.is_local:
+            try:
+                self.open('wb')
+                self.write(data)
+                self.close()
+            except OSError:
+                logger.exception('(OSError) Exception in saveBytesToFileAtomic()')
+                raise constants.AddonError('(OSError) Cannot write {0} file'.format(self.path_tr))
+            return
+
+        tmp_path = self.path_tr + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as file:
+                file.write(data)
+            os.replace(tmp_path, self.path_tr)
+        except OSError:
+            logger.exception('(OSError) Exception in saveBytesToFileAtomic()')
+            logger.error('(OSError) Cannot write {0} file'.format(self.path_tr))
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise constants.AddonError('(OSError) Cannot write {0} file'.format(self.path_tr))
+
     # Opens a propery file and reads it
     # Reads a given properties file with each line of the format key=value.
     # Returns a dictionary containing the pairs.
@@ -23,9 +23,13 @@ import typing
 
 import logging
 import random
+import threading
+import time
 from enum import Enum
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.error import HTTPError
 
 # AKL modules
@@ -97,10 +101,10 @@ def get_random_UserAgent():
         return 'Mozilla/5.0 (compatible; MSIE ' + version + '; ' + os_str + '; ' + token + 'Trident/' + engine + ')'
 
 
-def download_img(img_url, file_path: io.FileName):
+def download_img(img_url, file_path: io.FileName, session: requests.Session = None):
     # --- Download image to a buffer in memory ---
     # If an exception happens here no file is created (avoid creating files with 0 bytes).
-    file_data, http_code = get_URL(img_url, verify_ssl=False, content_type=ContentType.BYTES)
+    file_data, http_code = get_URL(img_url, verify_ssl=False, content_type=ContentType.BYTES, session=session)
     if http_code != 200:
         return
     
@@ -336,5 +340,50 @@ def post_JSON_URL(url, json_obj: any, headers:dict = None,
         return None, 500
 
 
-def start_http_session():
-    return requests.Session()
+# Creates a session which keeps connections alive and reuses them for subsequent
+# requests to the same host.
+# By default nothing is retried by the session, the scrapers retry failed requests themselves
+# (Scraper.RETRY_THRESHOLD). Retries would stack on top of those and of the request timeout.
+# If enabled only failed connections are retried, never requests that reached the server.
+#
+# @param pool_connections: [int] Number of host connection pools to cache.
+# @param pool_maxsize: [int] Maximum number of connections to keep per pool.
+# @param retries: [int] Number of retries on connection errors.
+def start_http_session(pool_connections=16, pool_maxsize=64, retries=0) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=retries, connect=retries, read=0, status=0, backoff_factor=0.3))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+# Limits the rate of requests to a web API. Tokens are refilled at rate tokens per second up to
+# capacity, every request takes one token. A capacity bigger than 1 allows short bursts.
+# Requests only wait when there are no tokens left. Safe to use from multiple threads.
+class TokenBucket(object):
+
+    # @param rate: [float] Tokens refilled per second.
+    # @param capacity: [float] Maximum number of tokens.
+    def __init__(self, rate: float, capacity: float = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    # Takes a token, sleeping until it is available.
+    # @return: [float] Seconds waited.
+    def consume(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # The token is reserved now, so concurrent callers queue up after this one.
+            self.tokens -= 1
+            wait_time = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return wait_time
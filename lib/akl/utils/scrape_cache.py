@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+#
+# Advanced Kodi Launcher persistent scraping results cache
+#
+
+# Copyright (c) Wintermute0110 <wintermute0110@gmail.com> / Chrisism <crizizz@gmail.com>
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; version 2 of the License.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# --- Python standard library ---
+from __future__ import unicode_literals
+from __future__ import division
+
+import typing
+
+import logging
+import json
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+# Stores the candidates found by a scraper for a search, so searching again for the same
+# game in a later scan does not hit the network. Backed by a SQLite database in WAL mode.
+# Inserts are committed every COMMIT_INTERVAL writes and when commit() is called.
+# Every result records the ROM that used it last, so it can be removed when that ROM is rescraped.
+class ScrapeResultCache(object):
+    DEFAULT_TTL = 90 * 86400  # 90 days in seconds
+    COMMIT_INTERVAL = 50
+    SCHEMA_VERSION = 1
+
+    # @param db_path: [str] Path to the SQLite database file. Created if missing.
+    # @param ttl: [int] Seconds stored results are used.
+    def __init__(self, db_path: str, ttl: int = DEFAULT_TTL):
+        self.db_path = db_path
+        self.ttl = ttl
+        self._conn = None
+        self._pending_writes = 0
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            # Tables of older versions are dropped, the stored results are only a cache.
+            if self._conn.execute('PRAGMA user_version').fetchone()[0] != ScrapeResultCache.SCHEMA_VERSION:
+                self._conn.execute('DROP TABLE IF EXISTS candidates')
+                self._conn.execute(f'PRAGMA user_version = {ScrapeResultCache.SCHEMA_VERSION}')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS candidates ('
+                'search_key TEXT PRIMARY KEY, rom_key TEXT, fetched_at INTEGER, candidates TEXT)')
+            self._conn.execute('CREATE INDEX IF NOT EXISTS candidates_rom_key ON candidates (rom_key)')
+        return self._conn
+
+    # Returns the stored list of candidates or None if not stored or expired.
+    def get_candidates(self, search_key: str) -> typing.Optional[list]:
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    'SELECT fetched_at, candidates FROM candidates WHERE search_key = ?', (search_key,)).fetchone()
+        except sqlite3.Error:
+            logger.exception('(sqlite3.Error) In ScrapeResultCache.get_candidates()')
+            return None
+
+        if row is None or time.time() - row[0] >= self.ttl:
+            return None
+        return json.loads(row[1])
+
+    def put_candidates(self, search_key: str, candidates: list, rom_key: str = None):
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    'INSERT OR REPLACE INTO candidates (search_key, rom_key, fetched_at, candidates) VALUES (?, ?, ?, ?)',
+                    (search_key, rom_key, int(time.time()), json.dumps(candidates, ensure_ascii=False)))
+                self._pending_writes += 1
+                if self._pending_writes >= ScrapeResultCache.COMMIT_INTERVAL:
+                    conn.commit()
+                    self._pending_writes = 0
+        except sqlite3.Error:
+            logger.exception('(sqlite3.Error) In ScrapeResultCache.put_candidates()')
+
+    # Removes the results last used by the given ROM.
+    def delete_rom_candidates(self, rom_key: str):
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute('DELETE FROM candidates WHERE rom_key = ?', (rom_key,))
+                self._pending_writes += 1
+                if self._pending_writes >= ScrapeResultCache.COMMIT_INTERVAL:
+                    conn.commit()
+                    self._pending_writes = 0
+        except sqlite3.Error:
+            logger.exception('(sqlite3.Error) In ScrapeResultCache.delete_rom_candidates()')
+
+    def commit(self):
+        with self._lock:
+            if self._conn is not None and self._pending_writes > 0:
+                self._conn.commit()
+                self._pending_writes = 0
+
+    def clear(self):
+        with self._lock:
+            conn = self._connect()
+            conn.execute('DELETE FROM candidates')
+            conn.commit()
+            self._pending_writes = 0
+
+    def close(self):
+        self.commit()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -8,6 +8,7 @@ import random
 import hashlib
 import re
 import html
+import functools
 
 logger = logging.getLogger(__name__)
 
@@ -213,6 +214,7 @@ def misc_generate_random_SID() -> str:
 # 1) Cleans ROM tags: [BIOS], (Europe), (Rev A), ...
 # 2) Substitutes some characters by spaces
 #
+@functools.lru_cache(maxsize=8192)
 def format_ROM_name_for_scraping(title):
     title = re.sub(r'\[.*?\]', '', title)
     title = re.sub(r'\(.*?\)', '', title)
@@ -235,6 +237,7 @@ def format_ROM_name_for_scraping(title):
 #
 # Returns a Unicode string.
 #
+@functools.lru_cache(maxsize=8192)
 def  format_ROM_title(title, clean_tags):
     #
     # Regexp to decompose a string in tokens
@@ -0,0 +1,169 @@
+import unittest, os, tempfile, shutil
+from unittest.mock import MagicMock
+
+import logging
+
+from lib.akl.scrapers import CandidateLoader, Scraper
+from lib.akl.utils.scrape_cache import ScrapeResultCache
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(format = '%(asctime)s %(module)s %(levelname)s: %(message)s',
+                datefmt = '%m/%d/%Y %I:%M:%S %p', level = logging.DEBUG)
+
+class Test_candidate_loader(unittest.TestCase):
+
+    def _create_scraper(self, batch_key_func):
+        scraper = MagicMock()
+        scraper.get_name.return_value = 'Fake'
+        scraper.get_candidates_batch_key.side_effect = batch_key_func
+        scraper.get_candidates.return_value = [{'id': '1', 'display_name': 'Super Mario World'}]
+        scraper.get_search_results_cache.return_value = None
+        return scraper
+
+    def test_when_searching_the_same_key_twice_the_scraper_is_called_once(self):
+        # arrange
+        scraper = self._create_scraper(lambda term, rom, platform: (term, platform))
+        target = CandidateLoader()
+
+        # act
+        first = target.load(scraper, 'Super Mario World', MagicMock(), 'Nintendo SNES', {'status': True})
+        second = target.load(scraper, 'Super Mario World', MagicMock(), 'Nintendo SNES', {'status': True})
+
+        # assert
+        assert first == second
+        assert scraper.get_candidates.call_count == 1
+
+    def test_when_scraper_has_no_batch_key_every_search_calls_the_scraper(self):
+        # arrange
+        scraper = self._create_scraper(lambda term, rom, platform: None)
+        target = CandidateLoader()
+
+        # act
+        target.load(scraper, 'Super Mario World', MagicMock(), 'Nintendo SNES', {'status': True})
+        target.load(scraper, 'Super Mario World', MagicMock(), 'Nintendo SNES', {'status': True})
+
+        # assert
+        assert scraper.get_candidates.call_count == 2
+
+    def test_when_prefetching_the_searches_are_batched(self):
+        # arrange
+        scraper = self._create_scraper(lambda term, rom, platform: (term, platform))
+        scraper.supports_candidates_batch.return_value = True
+        scraper.get_candidates_batch.side_effect = lambda items, status_dic: [[{'id': term}] for term, rom, platform in items]
+        search_items = [(f'game {i}', MagicMock(), 'MAME') for i in range(15)]
+        search_items.append(('game 0', MagicMock(), 'MAME'))
+        target = CandidateLoader()
+
+        # act
+        target.prefetch(scraper, search_items)
+        actual = target.load(scraper, 'game 12', MagicMock(), 'MAME', {'status': True})
+
+        # assert
+        assert scraper.get_candidates_batch.call_count == 2
+        assert actual == [{'id': 'game 12'}]
+        scraper.get_candidates.assert_not_called()
+
+    def test_when_searching_again_in_a_new_scan_the_stored_candidates_are_used(self):
+        # arrange
+        tmp_dir = tempfile.mkdtemp()
+        results_cache = ScrapeResultCache(os.path.join(tmp_dir, 'search_results.sqlite'))
+        scraper = self._create_scraper(lambda term, rom, platform: (term, platform))
+        scraper.get_search_results_cache.return_value = results_cache
+
+        try:
+            # act
+            first = CandidateLoader().load(scraper, 'Super Mario World', MagicMock(), 'Nintendo SNES', {'status': True})
+            second = CandidateLoader().load(scraper, 'Super Mario World', MagicMock(), 'Nintendo SNES', {'status': True})
+
+            # assert
+            assert first == second
+            assert scraper.get_candidates.call_count == 1
+        finally:
+            results_cache.close()
+            shutil.rmtree(tmp_dir)
+
+    def test_when_the_rom_is_rescraped_the_stored_candidates_are_not_used(self):
+        # arrange
+        tmp_dir = tempfile.mkdtemp()
+        results_cache = ScrapeResultCache(os.path.join(tmp_dir, 'search_results.sqlite'))
+        scraper = self._create_scraper(lambda term, rom, platform: (term, platform))
+        scraper.get_search_results_cache.return_value = results_cache
+        rom = MagicMock()
+        rom.get_identifier.return_value = 'Super Mario World (USA)'
+
+        try:
+            # act
+            CandidateLoader().load(scraper, 'Super Mario World', rom, 'Nintendo SNES', {'status': True})
+            results_cache.delete_rom_candidates(Scraper.get_search_results_rom_key('Super Mario World (USA)', 'Nintendo SNES'))
+            CandidateLoader().load(scraper, 'Super Mario World', rom, 'Nintendo SNES', {'status': True})
+
+            # assert
+            assert scraper.get_candidates.call_count == 2
+        finally:
+            results_cache.close()
+            shutil.rmtree(tmp_dir)
+
+    def test_when_reading_ahead_every_search_is_done_once(self):
+        # arrange
+        scraper = self._create_scraper(lambda term, rom, platform: (term, platform))
+        scraper.supports_concurrent_search.return_value = True
+        scraper.get_candidates.side_effect = lambda term, rom, platform, status_dic: [{'id': term}]
+        search_items = [(f'game {i}', MagicMock(), 'MAME') for i in range(3)]
+        target = CandidateLoader()
+
+        # act
+        target.read_ahead(scraper, search_items)
+        actual = [target.load(scraper, term, rom, platform, {'status': True}) for term, rom, platform in search_items]
+        target.close()
+
+        # assert
+        assert actual == [[{'id': 'game 0'}], [{'id': 'game 1'}], [{'id': 'game 2'}]]
+        assert scraper.get_candidates.call_count == 3
+
+    def test_when_reading_ahead_only_the_window_is_searched_ahead(self):
+        # arrange
+        scraper = self._create_scraper(lambda term, rom, platform: (term, platform))
+        scraper.supports_concurrent_search.return_value = True
+        scraper.get_candidates.side_effect = lambda term, rom, platform, status_dic: [{'id': term}]
+        search_items = [(f'game {i}', MagicMock(), 'MAME') for i in range(10)]
+        target = CandidateLoader()
+        target.READ_AHEAD_WINDOW = 2
+
+        # act
+        target.read_ahead(scraper, search_items)
+        pending_before = len(target.pending)
+        actual = target.load(scraper, 'game 1', MagicMock(), 'MAME', {'status': True})
+        pending_after = list(target.pending)
+        target.close()
+
+        # assert
+        assert pending_before == 2
+        assert actual == [{'id': 'game 1'}]
+        assert pending_after == [('Fake', ('game 2', 'MAME')), ('Fake', ('game 3', 'MAME'))]
+
+    def test_when_a_search_read_ahead_fails_the_error_is_counted_once_when_loaded(self):
+        # arrange
+        scraper = self._create_scraper(lambda term, rom, platform: (term, platform))
+        scraper.supports_concurrent_search.return_value = True
+        scraper.scraper_disabled = False
+        scraper.exception_counter = 0
+        scraper._handle_error.side_effect = lambda status_dic, user_msg: Scraper._handle_error(scraper, status_dic, user_msg)
+        scraper.get_candidates.side_effect = lambda term, rom, platform, status_dic: scraper._handle_error(status_dic, 'Error')
+        search_items = [('game 0', MagicMock(), 'MAME')]
+        status_dic = {'status': True}
+        target = CandidateLoader()
+
+        # act
+        target.read_ahead(scraper, search_items)
+        target.pending[('Fake', ('game 0', 'MAME'))].result()
+        counter_before = scraper.exception_counter
+        actual = target.load(scraper, 'game 0', MagicMock(), 'MAME', status_dic)
+        target.close()
+
+        # assert
+        assert counter_before == 0
+        assert actual is None
+        assert scraper.exception_counter == 1
+        assert scraper.get_candidates.call_count == 1
+        assert not status_dic['status']
+        assert status_dic['msg'] == 'Error'
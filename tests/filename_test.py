@@ -1,4 +1,4 @@
-import unittest, os
+import unittest, os, tempfile, shutil
 from unittest.mock import patch, MagicMock
 
 import logging
@@ -40,6 +40,25 @@ class Test_filename_test(unittest.TestCase):
         self.assertIsNotNone(actual)
         self.assertEqual(u'/data/user/0/com.retroarch/cores/', actual.path_tr)
         logger.info(actual.path_tr)
+
+    def test_when_saving_atomically_the_file_is_replaced_and_no_temp_file_remains(self):
+        # arrange
+        tmp_dir = tempfile.mkdtemp()
+        path = os.path.join(tmp_dir, 'cache.json')
+        with open(path, 'w') as f:
+            f.write('{"old": 1}')
+        target = io.FileName(path)
+
+        try:
+            # act
+            target.saveStrToFileAtomic('{"new": 2}')
+
+            # assert
+            with open(path) as f:
+                self.assertEqual('{"new": 2}', f.read())
+            self.assertEqual(['cache.json'], os.listdir(tmp_dir))
+        finally:
+            shutil.rmtree(tmp_dir)
         
 if __name__ == '__main__':
     unittest.main()
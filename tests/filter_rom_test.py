@@ -0,0 +1,81 @@
+import unittest, os, json, tempfile, shutil
+
+import logging
+
+from lib.akl.scrapers import FilterROM
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(format = '%(asctime)s %(module)s %(levelname)s: %(message)s',
+                datefmt = '%m/%d/%Y %I:%M:%S %p', level = logging.DEBUG)
+
+class Test_filter_rom(unittest.TestCase):
+
+    def _create_filter(self, ignore_bios: bool, platform='Nintendo SNES', addon_dir='/fake/dir'):
+        settings = {
+            'scraper_akloffline_addon_code_dir': addon_dir,
+            'scan_ignore_bios': ignore_bios
+        }
+        return FilterROM(None, settings, platform)
+
+    def test_when_filtering_a_no_intro_bios_it_is_filtered(self):
+        # arrange
+        target = self._create_filter(True)
+
+        # act
+        actual = target.ROM_is_filtered('[BIOS] CX4 (World).zip')
+
+        # assert
+        assert actual
+
+    def test_when_filtering_a_normal_rom_it_is_not_filtered(self):
+        # arrange
+        target = self._create_filter(True)
+
+        # act
+        actual = target.ROM_is_filtered('Super Mario World (Europe) (Rev 1).zip')
+
+        # assert
+        assert not actual
+
+    def test_when_filters_are_disabled_a_bios_is_not_filtered(self):
+        # arrange
+        target = self._create_filter(False)
+
+        # act
+        actual = target.ROM_is_filtered('[BIOS] CX4 (World).zip')
+
+        # assert
+        assert not actual
+
+    def test_when_bios_tag_is_not_at_the_start_it_is_still_filtered(self):
+        # arrange
+        target = self._create_filter(True)
+
+        # act
+        actual = target.ROM_is_filtered('Super Game Boy [BIOS] (World).zip')
+
+        # assert
+        assert actual
+
+    def test_when_filtering_mame_roms_the_databases_are_used(self):
+        # arrange
+        addon_dir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(addon_dir, 'data-AOS'))
+        for file_name, names in [('MAME_BIOSes.json', ['neogeo']),
+                                 ('MAME_Devices.json', ['z80']),
+                                 ('MAME_Mechanical.json', ['pinball'])]:
+            with open(os.path.join(addon_dir, 'data-AOS', file_name), 'w') as f:
+                json.dump(names, f)
+
+        try:
+            target = self._create_filter(True, 'MAME', addon_dir)
+            other = self._create_filter(True, 'MAME', addon_dir)
+
+            # act / assert
+            assert target.ROM_is_filtered('neogeo')
+            assert target.ROM_is_filtered('z80')
+            assert target.ROM_is_filtered('pinball')
+            assert not target.ROM_is_filtered('mslug')
+            assert target.BIOS_set is other.BIOS_set
+        finally:
+            shutil.rmtree(addon_dir)
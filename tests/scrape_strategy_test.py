@@ -0,0 +1,252 @@
+import unittest, os, tempfile, shutil
+from unittest.mock import patch, MagicMock
+
+import logging
+
+from lib.akl.api import ROMObj
+from lib.akl.utils import io, kodi
+from lib.akl import constants
+from lib.akl.scrapers import Null_Scraper, ScrapeStrategy, ScraperSettings
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(format = '%(asctime)s %(module)s %(levelname)s: %(message)s',
+                datefmt = '%m/%d/%Y %I:%M:%S %p', level = logging.DEBUG)
+
+POLICIES = [
+    constants.SCRAPE_POLICY_TITLE_ONLY,
+    constants.SCRAPE_POLICY_LOCAL_ONLY,
+    constants.SCRAPE_POLICY_LOCAL_AND_SCRAPE,
+    constants.SCRAPE_POLICY_SCRAPE_ONLY,
+]
+
+# The metadata action as decided by the if/elif chain the policy tables replaced.
+def expected_metadata_action(policy, NFO_file_found):
+    if policy == constants.SCRAPE_POLICY_TITLE_ONLY:
+        return ScrapeStrategy.ACTION_META_TITLE_ONLY
+    elif policy == constants.SCRAPE_POLICY_LOCAL_ONLY:
+        return ScrapeStrategy.ACTION_META_NFO_FILE if NFO_file_found else ScrapeStrategy.ACTION_META_TITLE_ONLY
+    elif policy == constants.SCRAPE_POLICY_LOCAL_AND_SCRAPE:
+        return ScrapeStrategy.ACTION_META_NFO_FILE if NFO_file_found else ScrapeStrategy.ACTION_META_SCRAPER
+    elif policy == constants.SCRAPE_POLICY_SCRAPE_ONLY:
+        return ScrapeStrategy.ACTION_META_SCRAPER
+    raise ValueError(policy)
+
+# The asset action as decided by the if/elif chain the policy tables replaced.
+def expected_asset_action(policy, scraper_supports_asset, local_asset_found):
+    if policy == constants.SCRAPE_POLICY_LOCAL_ONLY:
+        return ScrapeStrategy.ACTION_ASSET_LOCAL_ASSET
+    elif policy == constants.SCRAPE_POLICY_LOCAL_AND_SCRAPE:
+        if local_asset_found:
+            return ScrapeStrategy.ACTION_ASSET_LOCAL_ASSET
+        elif scraper_supports_asset:
+            return ScrapeStrategy.ACTION_ASSET_SCRAPER
+        return ScrapeStrategy.ACTION_ASSET_LOCAL_ASSET
+    elif policy == constants.SCRAPE_POLICY_SCRAPE_ONLY:
+        if scraper_supports_asset:
+            return ScrapeStrategy.ACTION_ASSET_SCRAPER
+        return ScrapeStrategy.ACTION_ASSET_LOCAL_ASSET
+    raise ValueError(policy)
+
+class Test_scrape_strategy(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        with open(os.path.join(self.tmp_dir, 'Castlevania.NFO'), 'w') as f:
+            f.write('<game></game>')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def _create_target(self, metadata_policy = constants.SCRAPE_POLICY_LOCAL_ONLY) -> ScrapeStrategy:
+        settings = ScraperSettings()
+        settings.scrape_metadata_policy = metadata_policy
+        settings.scrape_assets_policy = constants.SCRAPE_ACTION_NONE
+        target = ScrapeStrategy('', 0, settings, Null_Scraper(), MagicMock())
+        target._prepare_actions()
+        return target
+
+    def test_when_NFO_files_are_cached_the_name_is_matched_case_insensitive(self):
+        # arrange
+        rom = ROMObj({'scanned_data': {'file': os.path.join(self.tmp_dir, 'Castlevania.zip')}})
+        target = self._create_target()
+
+        # act
+        target._cache_NFO_files([rom])
+        actual = target._find_NFO_file(io.FileName(os.path.join(self.tmp_dir, 'Castlevania.nfo')))
+
+        # assert
+        assert actual is not None
+        assert actual.getBase() == 'Castlevania.NFO'
+
+    def test_when_NFO_files_are_not_cached_the_name_is_matched_case_insensitive(self):
+        # arrange
+        target = self._create_target()
+
+        # act
+        actual = target._find_NFO_file(io.FileName(os.path.join(self.tmp_dir, 'Castlevania.nfo')))
+        not_found = target._find_NFO_file(io.FileName(os.path.join(self.tmp_dir, 'Contra.nfo')))
+
+        # assert
+        assert actual is not None
+        assert actual.getBase() == 'Castlevania.NFO'
+        assert not_found is None
+
+    def test_metadata_actions_match_the_policies(self):
+        for policy in POLICIES:
+            for NFO_file_found in (False, True):
+                with self.subTest(policy=policy, NFO_file_found=NFO_file_found):
+                    # arrange
+                    ROM_name = 'Castlevania' if NFO_file_found else 'Contra'
+                    rom = ROMObj({'scanned_data': {'file': os.path.join(self.tmp_dir, f'{ROM_name}.zip')}})
+                    target = self._create_target(policy)
+
+                    # act
+                    target._process_ROM_metadata_begin(rom)
+
+                    # assert
+                    assert target.metadata_action == expected_metadata_action(policy, NFO_file_found)
+
+    def test_invalid_metadata_policy_raises_an_error(self):
+        # arrange
+        rom = ROMObj({'scanned_data': {'file': os.path.join(self.tmp_dir, 'Contra.zip')}})
+        target = self._create_target(-1)
+
+        # act and assert
+        with self.assertRaises(ValueError):
+            target._process_ROM_metadata_begin(rom)
+
+    def test_asset_actions_match_the_policies(self):
+        policies = [
+            constants.SCRAPE_POLICY_LOCAL_ONLY,
+            constants.SCRAPE_POLICY_LOCAL_AND_SCRAPE,
+            constants.SCRAPE_POLICY_SCRAPE_ONLY,
+        ]
+        for policy in policies:
+            for scraper_supports_asset in (False, True):
+                for local_asset_found in (False, True):
+                    with self.subTest(policy=policy, supports=scraper_supports_asset, local=local_asset_found):
+                        # arrange
+                        rom = MagicMock()
+                        rom.has_asset.return_value = False
+                        target = self._create_target()
+                        target.scraper_settings.scrape_assets_policy = policy
+                        target.scraper_settings.asset_IDs_to_scrape = [constants.ASSET_TITLE_ID]
+                        target.supported_asset_IDs = frozenset([constants.ASSET_TITLE_ID] if scraper_supports_asset else [])
+                        target._get_local_assets = MagicMock(
+                            return_value={constants.ASSET_TITLE_ID: '/fake/title.png' if local_asset_found else ''})
+
+                        # act
+                        target._process_ROM_assets_begin(rom)
+
+                        # assert
+                        expected = expected_asset_action(policy, scraper_supports_asset, local_asset_found)
+                        assert target.asset_action_list[constants.ASSET_TITLE_ID] == expected
+
+    def test_existing_assets_are_kept_if_overwrite_is_disabled(self):
+        for policy in [constants.SCRAPE_POLICY_LOCAL_ONLY, constants.SCRAPE_POLICY_SCRAPE_ONLY]:
+            with self.subTest(policy=policy):
+                # arrange
+                rom = MagicMock()
+                rom.has_asset.return_value = True
+                target = self._create_target()
+                target.scraper_settings.scrape_assets_policy = policy
+                target.scraper_settings.overwrite_existing_assets = False
+                target.scraper_settings.asset_IDs_to_scrape = [constants.ASSET_TITLE_ID]
+                target.supported_asset_IDs = frozenset([constants.ASSET_TITLE_ID])
+                target._get_local_assets = MagicMock(return_value={constants.ASSET_TITLE_ID: '/fake/title.png'})
+
+                # act
+                target._process_ROM_assets_begin(rom)
+
+                # assert
+                assert target.asset_action_list[constants.ASSET_TITLE_ID] == ScrapeStrategy.ACTION_ASSET_NONE
+                assert not target.any_asset_work
+
+    def test_invalid_asset_policy_raises_an_error(self):
+        # arrange
+        target = self._create_target()
+        target.scraper_settings.scrape_assets_policy = constants.SCRAPE_POLICY_TITLE_ONLY
+
+        # act and assert
+        with self.assertRaises(ValueError):
+            target._process_ROM_assets_begin(MagicMock())
+
+    def test_applying_metadata_sets_every_field(self):
+        # arrange
+        gamedata = {
+            'title': 'Castlevania', 'year': '1986', 'genre': 'Platform', 'developer': 'Konami',
+            'nplayers': '1', 'nplayers_online': '0', 'esrb': 'E', 'pegi': '7',
+            'plot': 'Vampire hunting', 'tags': ['classic']
+        }
+        rom = MagicMock()
+        rom.get_scanned_data_element_as_file.return_value = None
+        target = self._create_target()
+
+        # act
+        actual = target._apply_candidate_on_metadata(gamedata, rom)
+
+        # assert
+        assert actual
+        rom.set_name.assert_called_once_with('Castlevania')
+        rom.set_releaseyear.assert_called_once_with('1986')
+        rom.set_genre.assert_called_once_with('Platform')
+        rom.set_developer.assert_called_once_with('Konami')
+        rom.set_number_of_players.assert_called_once_with('1')
+        rom.set_number_of_players_online.assert_called_once_with('0')
+        rom.set_esrb_rating.assert_called_once_with('E')
+        rom.set_pegi_rating.assert_called_once_with('7')
+        rom.set_plot.assert_called_once_with('Vampire hunting')
+        rom.set_tags.assert_called_once_with(['classic'])
+
+    def test_settings_are_translated(self):
+        # arrange
+        expected = {
+            constants.SCRAPE_ACTION_NONE: 'No action',
+            constants.SCRAPE_POLICY_TITLE_ONLY: 'Use title only',
+            constants.SCRAPE_POLICY_LOCAL_ONLY: 'Use local files only',
+            constants.SCRAPE_POLICY_LOCAL_AND_SCRAPE: 'Local / Scrape',
+            constants.SCRAPE_POLICY_SCRAPE_ONLY: 'Scrape only',
+            constants.SCRAPE_MANUAL: 'Manual selection',
+            constants.SCRAPE_AUTOMATIC: 'Automatic selection',
+            12345: 12345,
+        }
+        target = self._create_target()
+
+        # act
+        actual = {key: target._translate(key) for key in expected}
+
+        # assert
+        assert actual == expected
+
+    @patch('lib.akl.scrapers.kodi.dialog_yesno_timer', return_value=False)
+    def test_when_scraping_continues_after_an_error_the_status_is_reset(self, dialog: MagicMock):
+        # arrange
+        status_dic = kodi.new_status_dic('No error')
+        status_dic['status'] = False
+        status_dic['dialog'] = kodi.KODI_MESSAGE_DIALOG
+        status_dic['msg'] = 'Scraper error'
+        target = self._create_target()
+
+        # act
+        actual = target._report_scraper_error(status_dic)
+
+        # assert
+        assert not actual
+        assert status_dic == kodi.new_status_dic('No error')
+        target.pdialog.reopen.assert_called_once()
+
+    @patch('lib.akl.scrapers.kodi.dialog_yesno_timer', return_value=True)
+    def test_when_scraping_is_stopped_after_an_error_the_status_is_canceled(self, dialog: MagicMock):
+        # arrange
+        status_dic = kodi.new_status_dic('No error')
+        status_dic['status'] = False
+        status_dic['msg'] = 'Scraper error'
+        target = self._create_target()
+
+        # act
+        actual = target._report_scraper_error(status_dic)
+
+        # assert
+        assert actual
+        assert not status_dic['status']
+        assert status_dic['dialog'] == kodi.KODI_MESSAGE_CANCEL
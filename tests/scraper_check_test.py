@@ -0,0 +1,56 @@
+import unittest, tempfile, shutil
+from unittest.mock import MagicMock
+
+import logging
+
+from lib.akl.scrapers import Null_Scraper, Scraper
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(format = '%(asctime)s %(module)s %(levelname)s: %(message)s',
+                datefmt = '%m/%d/%Y %I:%M:%S %p', level = logging.DEBUG)
+
+class FakeCheckedScraper(Null_Scraper):
+    def __init__(self, cache_dir):
+        Scraper.__init__(self, cache_dir)
+        self.check_mock = MagicMock()
+
+    def get_check_key(self):
+        return 'fake-api-key'
+
+    def check_before_scraping(self, status_dic):
+        self.check_mock(status_dic)
+
+class Test_scraper_check(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_when_checking_again_within_the_ttl_the_check_is_skipped(self):
+        # arrange
+        status_dic = {'status': True, 'dialog': None, 'msg': 'No error'}
+        first = FakeCheckedScraper(self.tmp_dir)
+        second = FakeCheckedScraper(self.tmp_dir)
+
+        # act
+        first.check_before_scraping_cached(status_dic)
+        second.check_before_scraping_cached(status_dic)
+
+        # assert
+        assert first.check_mock.call_count == 1
+        second.check_mock.assert_not_called()
+
+    def test_when_the_check_fails_it_is_not_reused(self):
+        # arrange
+        status_dic = {'status': False, 'dialog': None, 'msg': 'Missing API key'}
+        first = FakeCheckedScraper(self.tmp_dir)
+        second = FakeCheckedScraper(self.tmp_dir)
+
+        # act
+        first.check_before_scraping_cached(status_dic)
+        second.check_before_scraping_cached(status_dic)
+
+        # assert
+        assert second.check_mock.call_count == 1
@@ -0,0 +1,184 @@
+import unittest, os, tempfile, shutil, threading
+from unittest.mock import MagicMock
+
+import logging
+
+from lib.akl.scrapers import Null_Scraper, Scraper
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(format = '%(asctime)s %(module)s %(levelname)s: %(message)s',
+                datefmt = '%m/%d/%Y %I:%M:%S %p', level = logging.DEBUG)
+
+class FakeCachingScraper(Null_Scraper):
+    FLUSH_DELAY_SEC = None
+
+    def __init__(self, cache_dir):
+        Scraper.__init__(self, cache_dir)
+
+    def get_filename(self):
+        return 'Fake'
+
+    def supports_disk_cache(self):
+        return True
+
+class Test_scraper_disk_cache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_when_flushing_the_candidates_a_new_scraper_loads_them(self):
+        # arrange
+        candidate = {'id': '1', 'display_name': 'Pokémon Rouge', 'platform': 'Nintendo GB'}
+        target = FakeCachingScraper(self.tmp_dir)
+        target.set_candidate('Pokemon Rouge (France)', 'Nintendo GB', candidate)
+
+        # act
+        target.flush_disk_cache()
+        other = FakeCachingScraper(self.tmp_dir)
+        actual = other.get_cached_candidates(['Pokemon Rouge (France)', 'Tetris'], 'Nintendo GB')
+
+        # assert
+        assert actual == {'Pokemon Rouge (France)': candidate}
+
+    def test_when_flushing_a_few_changes_they_are_appended_to_the_journal(self):
+        # arrange
+        target = FakeCachingScraper(self.tmp_dir)
+        for i in range(10):
+            target.set_candidate(f'Game {i}', 'MAME', {'id': str(i)})
+        target.flush_disk_cache()
+
+        # act
+        target.set_candidate('Game 10', 'MAME', {'id': '10'})
+        target.check_candidates_cache('Game 0', 'MAME')
+        target.clear_cache('Game 0', 'MAME')
+        target.flush_disk_cache()
+        other = FakeCachingScraper(self.tmp_dir)
+        actual = other.get_cached_candidates([f'Game {i}' for i in range(11)], 'MAME')
+
+        # assert
+        assert os.path.isfile(os.path.join(self.tmp_dir, 'Fake__MAME__candidates.jsonl'))
+        assert 'Game 0' not in actual
+        assert actual['Game 10'] == {'id': '10'}
+        assert len(actual) == 10
+
+    def test_when_flushing_the_cache_file_is_compressed_and_plain_files_still_load(self):
+        # arrange
+        with open(os.path.join(self.tmp_dir, 'Fake__MAME__candidates.json'), 'w') as f:
+            f.write('{"Game 1": {"id": "1"}}')
+        target = FakeCachingScraper(self.tmp_dir)
+
+        # act
+        target.set_candidate('Game 2', 'MAME', {'id': '2'})
+        target.COMPRESS_DISK_CACHE = True
+        target.JOURNAL_MAX_RATIO = 0
+        target.flush_disk_cache()
+        other = FakeCachingScraper(self.tmp_dir)
+        actual = other.get_cached_candidates(['Game 1', 'Game 2'], 'MAME')
+
+        # assert
+        assert not os.path.exists(os.path.join(self.tmp_dir, 'Fake__MAME__candidates.json'))
+        with open(os.path.join(self.tmp_dir, 'Fake__MAME__candidates.json.gz'), 'rb') as f:
+            assert f.read(2) == b'\x1f\x8b'
+        assert actual == {'Game 1': {'id': '1'}, 'Game 2': {'id': '2'}}
+
+    def test_when_an_older_version_rewrote_the_plain_file_it_is_loaded_without_the_journal(self):
+        # arrange
+        target = FakeCachingScraper(self.tmp_dir)
+        for i in range(10):
+            target.set_candidate(f'Game {i}', 'MAME', {'id': str(i)})
+        target.flush_disk_cache()
+        target.set_candidate('Game 10', 'MAME', {'id': '10'})
+        target.flush_disk_cache()
+        with open(os.path.join(self.tmp_dir, 'Fake__MAME__candidates.json'), 'w') as f:
+            f.write('{"Game 1": {"id": "old"}}')
+
+        # act
+        other = FakeCachingScraper(self.tmp_dir)
+        actual = other.get_cached_candidates(['Game 1', 'Game 10'], 'MAME')
+
+        # assert
+        assert actual == {'Game 1': {'id': 'old'}}
+
+    def test_when_a_flush_delay_is_set_a_burst_of_changes_is_flushed_once_in_background(self):
+        # arrange
+        target = FakeCachingScraper(self.tmp_dir)
+        target.FLUSH_DELAY_SEC = 0.2
+        target._flush_disk_cache = MagicMock(wraps=target._flush_disk_cache)
+
+        # act
+        target.set_candidate('Game 0', 'MAME', {'id': '0'})
+        flush_timer = target.flush_timer
+        for i in range(1, 5):
+            target.set_candidate(f'Game {i}', 'MAME', {'id': str(i)})
+        assert target.flush_timer is flush_timer
+        # The timer waits again for the changes made after it started.
+        timer = flush_timer
+        while timer is not None:
+            timer.join()
+            timer = next((t for t in threading.enumerate() if isinstance(t, threading.Timer)), None)
+        other = FakeCachingScraper(self.tmp_dir)
+        actual = other.get_cached_candidates([f'Game {i}' for i in range(5)], 'MAME')
+
+        # assert
+        assert target._flush_disk_cache.call_count == 1
+        assert len(actual) == 5
+
+    def test_when_a_subclass_only_marks_the_cache_dirty_it_is_flushed(self):
+        # arrange
+        target = FakeCachingScraper(self.tmp_dir)
+        target.platform = 'MAME'
+        target._lazy_load_disk_cache(Scraper.CACHE_METADATA)
+
+        # act
+        target.disk_caches[Scraper.CACHE_METADATA]['Game 1'] = {'title': 'Game 1'}
+        target.disk_caches_dirty[Scraper.CACHE_METADATA] = True
+        target.flush_disk_cache()
+        other = FakeCachingScraper(self.tmp_dir)
+        other.platform = 'MAME'
+
+        # assert
+        assert other._check_disk_cache(Scraper.CACHE_METADATA, 'Game 1')
+
+    def test_when_the_cache_is_also_changed_directly_it_is_written_fully(self):
+        # arrange
+        target = FakeCachingScraper(self.tmp_dir)
+        for i in range(10):
+            target.set_candidate(f'Game {i}', 'MAME', {'id': str(i)})
+        target.flush_disk_cache()
+
+        # act
+        target.set_candidate('Game 10', 'MAME', {'id': '10'})
+        target.disk_caches[Scraper.CACHE_CANDIDATES]['Game 11'] = {'id': '11'}
+        target.disk_caches_dirty[Scraper.CACHE_CANDIDATES] = True
+        target.flush_disk_cache()
+        other = FakeCachingScraper(self.tmp_dir)
+        actual = other.get_cached_candidates(['Game 10', 'Game 11'], 'MAME')
+
+        # assert
+        assert not os.path.exists(os.path.join(self.tmp_dir, 'Fake__MAME__candidates.jsonl'))
+        assert actual == {'Game 10': {'id': '10'}, 'Game 11': {'id': '11'}}
+
+    def test_when_a_journal_of_an_older_cache_file_is_left_it_is_ignored(self):
+        # arrange
+        journal_path = os.path.join(self.tmp_dir, 'Fake__MAME__candidates.jsonl')
+        target = FakeCachingScraper(self.tmp_dir)
+        for i in range(10):
+            target.set_candidate(f'Game {i}', 'MAME', {'id': str(i)})
+        target.flush_disk_cache()
+        target.set_candidate('Game 5', 'MAME', {'id': 'old'})
+        target.flush_disk_cache()
+        shutil.copy(journal_path, journal_path + '.bak')
+
+        # act
+        target.JOURNAL_MAX_RATIO = 0
+        target.set_candidate('Game 5', 'MAME', {'id': 'new'})
+        target.flush_disk_cache()
+        shutil.move(journal_path + '.bak', journal_path)
+        other = FakeCachingScraper(self.tmp_dir)
+        actual = other.get_cached_candidates(['Game 5'], 'MAME')
+
+        # assert
+        assert actual == {'Game 5': {'id': 'new'}}
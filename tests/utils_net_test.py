@@ -0,0 +1,27 @@
+import unittest
+from unittest.mock import patch
+
+import logging
+
+from lib.akl.utils import net
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(format = '%(asctime)s %(module)s %(levelname)s: %(message)s',
+                datefmt = '%m/%d/%Y %I:%M:%S %p', level = logging.DEBUG)
+
+class Test_utils_net_tests(unittest.TestCase):
+
+    @patch('lib.akl.utils.net.time.sleep')
+    def test_when_the_bucket_is_empty_consume_waits_for_a_token(self, sleep_mock):
+        # arrange
+        target = net.TokenBucket(rate=1, capacity=2)
+
+        # act
+        first = target.consume()
+        second = target.consume()
+        third = target.consume()
+
+        # assert
+        assert first == 0 and second == 0
+        assert 0.9 < third <= 1
+        sleep_mock.assert_called_once()
@@ -59,6 +59,35 @@ class Test_utilstests(unittest.TestCase):
         # assert
         assert actual == expected
 
+    def test_when_formatting_the_same_rom_title_with_and_without_cleaning_tags_both_results_are_correct(self):
+
+        # arrange
+        title = 'Super Mario World (Europe) (Rev 1)'
+
+        # act
+        cleaned = text.format_ROM_title(title, True)
+        not_cleaned = text.format_ROM_title(title, False)
+        cleaned_again = text.format_ROM_title(title, True)
+
+        # assert
+        assert cleaned == 'Super Mario World'
+        assert not_cleaned == title
+        assert cleaned_again == cleaned
+
+
+    def test_when_formatting_duplicate_rom_titles_the_cached_result_is_reused(self):
+
+        # arrange
+        text.format_ROM_title.cache_clear()
+        basenames = ['Final Fantasy VII (USA) (Disc 1)', 'Final Fantasy VII (USA) (Disc 1)']
+
+        # act
+        actual = [text.format_ROM_title(basename, True) for basename in basenames]
+
+        # assert
+        assert actual == ['Final Fantasy VII', 'Final Fantasy VII']
+        assert text.format_ROM_title.cache_info().hits == 1
+
 
 if __name__ == '__main__':
     unittest.main()